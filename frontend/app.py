@@ -2,16 +2,16 @@ import streamlit as st
 import json
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 # Add parent to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.llm_client import LocalLLMClient
 from src.generator import EnhancedTemplateGenerator
 from src.dxf_creator import EnhancedDXFCreator
 from src.conversation_manager import ConversationManager
+from src.prompt_cache import PromptCache, load_sentence_embedder
 
 # ============================================================
 # CONFIG
@@ -98,6 +98,8 @@ def load_template_parser():
 
 @st.cache_resource
 def load_llm():
+    # Imported on first use: the LLM stack is slow to import and unused in Template mode
+    from src.llm_client import LocalLLMClient
     try:
         llm = LocalLLMClient()
         return llm
@@ -105,6 +107,10 @@ def load_llm():
         st.warning(f"LLM not available: {e}")
         return None
 
+@st.cache_resource
+def load_prompt_cache():
+    return PromptCache(embedder=load_sentence_embedder())
+
 # ============================================================
 # MODE 1: CHAT & DESIGN
 # ============================================================
@@ -143,8 +149,17 @@ if mode == "💬 Chat & Design":
             try:
                 template_parser = load_template_parser()
                 
+                # Only the LLM modes are cached; the template parser is faster than an embedding
+                cached = None
+                if parser_type != "Template (Fast)":
+                    prompt_cache = load_prompt_cache()
+                    cached = prompt_cache.get(user_input, parser_type)
+                
                 # Parse based on mode
-                if parser_type == "Template (Fast)":
+                if cached is not None:
+                    params, method = cached
+                
+                elif parser_type == "Template (Fast)":
                     params = template_parser.parse_description(user_input)
                     method = "Template Parser"
                 
@@ -170,13 +185,22 @@ if mode == "💬 Chat & Design":
                 if "error" in params:
                     raise ValueError("Could not parse")
                 
+                # Model results only: a fallback after a transient model failure must not stick
+                if cached is None and params.get("_source") == "llm":
+                    prompt_cache.put(user_input, parser_type, (params, method))
+                
                 # Generate DXF
+                # Per request: a creator holds its document, a shared one would mix sessions' drawings
                 creator = EnhancedDXFCreator()
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.time_ns()
                 output_file = f"data/examples/chat_{timestamp}.dxf"
                 
+                dxf_bytes = creator.create_from_params_bytes(params)
+                
+                # Keep a copy on disk for the generated files history
                 os.makedirs("data/examples", exist_ok=True)
-                dxf_path = creator.create_from_params(params, output_file)
+                Path(output_file).write_bytes(dxf_bytes)
+                dxf_path = output_file
                 
                 # Store
                 st.session_state.manager.update_design(params)
@@ -195,14 +219,13 @@ if mode == "💬 Chat & Design":
                 })
                 
                 # Download button
-                with open(dxf_path, 'rb') as f:
-                    st.download_button(
-                        label="📥 Download DXF File",
-                        data=f.read(),
-                        file_name=os.path.basename(dxf_path),
-                        mime="application/octet-stream",
-                        use_container_width=True
-                    )
+                st.download_button(
+                    label="📥 Download DXF File",
+                    data=dxf_bytes,
+                    file_name=os.path.basename(dxf_path),
+                    mime="application/octet-stream",
+                    use_container_width=True
+                )
                 
                 st.rerun()
                 
@@ -240,22 +263,19 @@ elif mode == "⚡ Quick Generate":
                     params = template_parser.parse_description(description)
                     
                     creator = EnhancedDXFCreator()
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    output_file = f"data/examples/quick_{timestamp}.dxf"
-                    
-                    os.makedirs("data/examples", exist_ok=True)
-                    dxf_path = creator.create_from_params(params, output_file)
+                    timestamp = time.time_ns()
+                    file_name = f"quick_{timestamp}.dxf"
+                    dxf_bytes = creator.create_from_params_bytes(params)
                     
                     st.success("✅ Generated!")
                     
-                    with open(dxf_path, 'rb') as f:
-                        st.download_button(
-                            label="📥 Download DXF",
-                            data=f.read(),
-                            file_name=os.path.basename(dxf_path),
-                            mime="application/octet-stream",
-                            use_container_width=True
-                        )
+                    st.download_button(
+                        label="📥 Download DXF",
+                        data=dxf_bytes,
+                        file_name=file_name,
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
                     
                     st.json(params)
                 
@@ -1,10 +1,16 @@
 # main.py - Enhanced pipeline
 from src.generator import EnhancedTemplateGenerator
 from src.dxf_creator import EnhancedDXFCreator
-import json
+from src import json_utils
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import contextlib
+import functools
+import io
 
-def process_test_case(test_case, output_dir="data/examples"):
-    """Process a single test case"""
+def process_test_case(test_case, output_dir="data/examples", gen=None, creator=None):
+    """Process a single test case, reusing gen/creator when given"""
     tc_id = test_case['id']
     description = test_case['description']
     
@@ -13,13 +19,15 @@ def process_test_case(test_case, output_dir="data/examples"):
     print(f"Description: {description}")
     
     # Parse
-    gen = EnhancedTemplateGenerator()
+    if gen is None:
+        gen = EnhancedTemplateGenerator()
     params = gen.parse_description(description)
     print(f"Parsed: {params}")
     
     # Create DXF
     try:
-        creator = EnhancedDXFCreator()
+        if creator is None:
+            creator = EnhancedDXFCreator()
         output_file = f"{output_dir}/test_case_{tc_id:03d}.dxf"
         result = creator.create_from_params(params, output_file)
         print(f"✅ Created: {result}")
@@ -28,10 +36,25 @@ def process_test_case(test_case, output_dir="data/examples"):
         print(f"❌ Error: {e}")
         return False
 
-def process_all_test_cases():
-    """Process all test cases"""
-    with open('data/test_cases.json', 'r') as f:
-        data = json.load(f)
+# Per-process parser/creator for pool workers, built by _init_worker
+_worker_gen = None
+_worker_creator = None
+
+def _init_worker():
+    global _worker_gen, _worker_creator
+    _worker_gen = EnhancedTemplateGenerator()
+    _worker_creator = EnhancedDXFCreator()
+
+def _process_in_worker(test_case, output_dir="data/examples"):
+    """Run process_test_case in a pool worker and return (ok, printed output)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        ok = process_test_case(test_case, output_dir, gen=_worker_gen, creator=_worker_creator)
+    return ok, buffer.getvalue()
+
+def process_all_test_cases(max_workers=None, output_dir="data/examples"):
+    """Process all test cases, across max_workers processes when given (default: sequential)"""
+    data = json_utils.loads(Path('data/test_cases.json').read_bytes())
     
     print("="*60)
     print("CADGen-AI - Processing All Test Cases")
@@ -39,10 +62,25 @@ def process_all_test_cases():
     
     success_count = 0
     total_count = len(data['test_cases'])
+    # Opt-in only: for the bundled cases pool startup costs more than it saves
+    workers = min(max_workers or 1, total_count)
     
-    for tc in data['test_cases']:
-        if process_test_case(tc):
-            success_count += 1
+    if workers > 1:
+        # Workers capture their output so it is printed in test case order
+        chunksize = max(1, total_count // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+            work = functools.partial(_process_in_worker, output_dir=output_dir)
+            for ok, output in ex.map(work, data['test_cases'], chunksize=chunksize):
+                print(output, end="")
+                if ok:
+                    success_count += 1
+    else:
+        gen = EnhancedTemplateGenerator()
+        creator = EnhancedDXFCreator()
+        
+        for tc in data['test_cases']:
+            if process_test_case(tc, output_dir, gen=gen, creator=creator):
+                success_count += 1
     
     print("\n" + "="*60)
     print(f"Results: {success_count}/{total_count} ({success_count*100//total_count}%) successful")
@@ -51,7 +89,12 @@ def process_all_test_cases():
     return success_count, total_count
 
 if __name__ == "__main__":
-    success, total = process_all_test_cases()
+    parser = argparse.ArgumentParser(description="Parse all test cases and write their DXF files")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Process test cases across N worker processes (default: sequential)")
+    args = parser.parse_args()
+    
+    success, total = process_all_test_cases(max_workers=args.workers)
     
     if success >= total * 0.7:  # 70% threshold
         print("\n🎉 SUCCESS! Pipeline meets 70% accuracy threshold!")
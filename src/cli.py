@@ -9,14 +9,13 @@ Usage:
     python -m src.cli --output-dxf output.dxf "rectangular plate 200mm by 100mm"
 """
 import argparse
-import json
+import functools
 import logging
 import sys
 from pathlib import Path
 
+from src import json_utils
 from src.generator import EnhancedTemplateGenerator
-from src.dxf_creator import EnhancedDXFCreator
-from src.validator import validate_params
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +42,13 @@ def setup_logging(verbose: bool = False, debug: bool = False) -> None:
     )
 
 
+def ensure_parent_dir(path: Path) -> None:
+    """Create the parent directories of an output path if they are missing."""
+    # One stat in the common case; mkdir(exist_ok=True) costs a failed mkdir plus a stat
+    if not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+
 def extract_with_llm(description: str) -> dict:
     """Extract parameters using LLM client."""
     from src.llm_client import LocalLLMClient
@@ -61,20 +67,14 @@ def extract_with_fallback(description: str) -> dict:
 
 def create_dxf(params: dict, output_path: str) -> str:
     """Create DXF file from parameters."""
+    from src.dxf_creator import EnhancedDXFCreator
     creator = EnhancedDXFCreator()
     return creator.create_from_params(params, output_path)
 
 
-def main(argv=None) -> int:
-    """
-    Main CLI entry point.
-
-    Args:
-        argv: Command line arguments (defaults to sys.argv[1:])
-
-    Returns:
-        Exit code
-    """
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args keeps no state between calls."""
     parser = argparse.ArgumentParser(
         description="Extract CAD parameters from natural language and optionally generate DXF",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -133,7 +133,20 @@ Examples:
         help="Enable debug output"
     )
 
-    args = parser.parse_args(argv)
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    args = _build_parser().parse_args(argv)
 
     setup_logging(verbose=args.verbose, debug=args.debug)
 
@@ -157,6 +170,8 @@ Examples:
 
         # Validate if requested
         if not args.no_validate:
+            # jsonschema is imported with the validator, skip it for --no-validate
+            from src.validator import validate_params
             is_valid, errors = validate_params(params)
             if not is_valid:
                 logger.error(f"Validation errors: {errors}")
@@ -164,21 +179,20 @@ Examples:
                 # Don't fail entirely - still output the params
 
         # Output JSON
-        json_output = json.dumps(params, indent=2)
-
         if args.output_json:
             output_path = Path(args.output_json)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(json_output)
+            ensure_parent_dir(output_path)
+            output_path.write_bytes(json_utils.dumps_bytes(params))
             logger.info(f"JSON written to: {args.output_json}")
         else:
-            print(json_output)
+            # One write for document and newline; print() issues two
+            sys.stdout.write(json_utils.dumps(params) + "\n")
 
         # Generate DXF if requested
         if args.output_dxf:
             try:
                 dxf_path = Path(args.output_dxf)
-                dxf_path.parent.mkdir(parents=True, exist_ok=True)
+                ensure_parent_dir(dxf_path)
                 result = create_dxf(params, str(dxf_path))
                 logger.info(f"DXF created: {result}")
                 print(f"DXF file created: {result}", file=sys.stderr)
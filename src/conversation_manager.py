@@ -1,14 +1,21 @@
-import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import time
+from typing import Any, List, Dict, Optional, Tuple
+
+from src import json_utils
+
+# Marks keys that did not exist before an update
+_MISSING = object()
 
 class ConversationManager:
     """Manages multi-turn conversations with full context"""
     
+    __slots__ = ('conversation_history', 'current_design', '_undo_log', 'feedback_list')
+    
     def __init__(self):
         self.conversation_history = []
         self.current_design = {}
-        self.parameters_stack = []
+        # One [(key, previous value), ...] entry per update_design call
+        self._undo_log: List[List[Tuple[str, Any]]] = []
         self.feedback_list = []
     
     def add_message(self, role: str, content: str):
@@ -16,13 +23,13 @@ class ConversationManager:
         self.conversation_history.append({
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time_ns()  # ns since the epoch, format only for display
         })
     
     def update_design(self, parameters: Dict):
-        """Update design and store in stack"""
+        """Update design and log the values it replaces"""
+        self._undo_log.append([(key, self.current_design.get(key, _MISSING)) for key in parameters])
         self.current_design.update(parameters)
-        self.parameters_stack.append(self.current_design.copy())
     
     def refine(self, feedback: str):
         """Store refinement feedback"""
@@ -30,23 +37,25 @@ class ConversationManager:
     
     def undo(self) -> bool:
         """Undo last change"""
-        if len(self.parameters_stack) > 1:
-            self.parameters_stack.pop()
-            self.current_design = self.parameters_stack[-1].copy()
+        if len(self._undo_log) > 1:
+            for key, previous in self._undo_log.pop():
+                if previous is _MISSING:
+                    del self.current_design[key]
+                else:
+                    self.current_design[key] = previous
             return True
         return False
     
     def get_summary(self) -> str:
         """Get current design summary"""
-        return json.dumps(self.current_design, indent=2)
+        return json_utils.dumps(self.current_design)
     
     def get_context(self, last_n: int = 3) -> str:
         """Get last N messages as context"""
         msgs = self.conversation_history[-last_n:]
-        context = "Recent conversation:\n"
-        for msg in msgs:
-            context += f"{msg['role']}: {msg['content']}\n"
-        return context
+        parts = ["Recent conversation:\n"]
+        parts.extend(f"{msg['role']}: {msg['content']}\n" for msg in msgs)
+        return "".join(parts)
 
 if __name__ == "__main__":
     mgr = ConversationManager()
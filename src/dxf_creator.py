@@ -1,15 +1,77 @@
 # src/dxf_creator.py - Enhanced version
-import ezdxf
+import functools
+import importlib.util
+import io
+import logging
 import math
 
+logger = logging.getLogger(__name__)
+
+# Unit-radius circle block that holes reference when use_hole_blocks is set
+HOLE_BLOCK = 'HOLE'
+
+# numba is optional and only imported when PCD holes are first drawn
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _pcd_positions_kernel(out, pcd_radius, cx, cy):
+    """Fill out[i] with the centre of hole i on the pitch circle"""
+    n = out.shape[0]
+    step = 2.0 * math.pi / n
+    for i in range(n):
+        angle = i * step
+        out[i, 0] = cx + pcd_radius * math.cos(angle)
+        out[i, 1] = cy + pcd_radius * math.sin(angle)
+
+
+@functools.lru_cache(maxsize=1)
+def _jit_pcd_kernel():
+    """Compile _pcd_positions_kernel and warm it up, or None if numba cannot be used"""
+    import numpy as np
+    
+    # find_spec only sees the package; it can still fail to import (e.g. a NumPy
+    # version mismatch) or to compile. None is cached, so that is tried only once.
+    try:
+        from numba import njit
+        kernel = njit(cache=True)(_pcd_positions_kernel)
+        kernel(np.empty((1, 2)), 1.0, 0.0, 0.0)
+    except Exception as e:
+        logger.warning(f"numba unusable, computing PCD positions with NumPy: {e}")
+        return None
+    return kernel
+
+
+def _compute_pcd_positions(hole_count, pcd_radius, cx, cy):
+    """Return a (hole_count, 2) float64 array of hole centres on the pitch circle"""
+    import numpy as np
+    
+    kernel = _jit_pcd_kernel() if NUMBA_AVAILABLE else None
+    if kernel is not None:
+        out = np.empty((hole_count, 2))
+        kernel(out, float(pcd_radius), float(cx), float(cy))
+        return out
+    
+    angles = np.arange(hole_count) * (2 * np.pi / hole_count)
+    return np.column_stack((cx + pcd_radius * np.cos(angles), cy + pcd_radius * np.sin(angles)))
+
+
 class EnhancedDXFCreator:
-    def __init__(self):
+    __slots__ = ('doc', 'msp', 'use_hole_blocks')
+    
+    def __init__(self, use_hole_blocks=False):
         self.doc = None
         self.msp = None
+        # Place holes as INSERTs of HOLE_BLOCK scaled to the hole radius
+        # instead of one CIRCLE entity per hole
+        self.use_hole_blocks = use_hole_blocks
     
     def create_new(self):
+        # Imported here so code that only parses descriptions never loads ezdxf
+        import ezdxf
         self.doc = ezdxf.new(dxfversion='R2010')
         self.msp = self.doc.modelspace()
+        if self.use_hole_blocks:
+            self.doc.blocks.new(HOLE_BLOCK).add_circle((0, 0), radius=1.0)
         return self
     
     def add_rectangle(self, width, height, origin=(0, 0)):
@@ -22,33 +84,35 @@ class EnhancedDXFCreator:
         self.msp.add_circle(center, radius=radius)
         return self
     
+    def _hole_adder(self, radius):
+        """Return add(center) placing one hole of the given radius"""
+        if self.use_hole_blocks:
+            # add_blockref copies dxfattribs, so one dict serves every hole
+            attribs = {'xscale': radius, 'yscale': radius}
+            return functools.partial(self.msp.add_blockref, HOLE_BLOCK, dxfattribs=attribs)
+        return functools.partial(self.msp.add_circle, radius=radius)
+    
     def add_corner_holes(self, width, height, offset, radius):
-        positions = [
-            (offset, offset),
-            (width - offset, offset),
-            (width - offset, height - offset),
-            (offset, height - offset)
-        ]
-        for pos in positions:
-            self.add_circle(pos, radius)
+        add = self._hole_adder(radius)
+        add((offset, offset))
+        add((width - offset, offset))
+        add((width - offset, height - offset))
+        add((offset, height - offset))
         return self
     
     def add_center_hole(self, width, height, radius):
         center = (width / 2, height / 2)
-        self.add_circle(center, radius)
+        self._hole_adder(radius)(center)
         return self
     
     def add_holes_on_pcd(self, pcd_diameter, hole_count, hole_radius, center=(0, 0)):
         """Add holes equally spaced on a pitch circle diameter"""
         cx, cy = center
-        pcd_radius = pcd_diameter / 2
-        angle_step = 2 * math.pi / hole_count
+        positions = _compute_pcd_positions(hole_count, pcd_diameter / 2, cx, cy)
         
-        for i in range(hole_count):
-            angle = i * angle_step
-            x = cx + pcd_radius * math.cos(angle)
-            y = cy + pcd_radius * math.sin(angle)
-            self.add_circle((x, y), hole_radius)
+        add = self._hole_adder(hole_radius)
+        for x, y in positions.tolist():
+            add((x, y))
         return self
     
     def add_flange(self, outer_diameter, inner_diameter, center=(0, 0)):
@@ -59,6 +123,16 @@ class EnhancedDXFCreator:
     
     def create_from_params(self, params, output_file):
         """Create DXF from parsed parameters"""
+        self.draw_from_params(params)
+        return self.save(output_file)
+    
+    def create_from_params_bytes(self, params):
+        """Create DXF from parsed parameters and return the file contents"""
+        self.draw_from_params(params)
+        return self.to_bytes()
+    
+    def draw_from_params(self, params):
+        """Build a new document from parsed parameters"""
         self.create_new()
         
         shape_type = params.get('type', 'rectangular')
@@ -102,11 +176,17 @@ class EnhancedDXFCreator:
                         center
                     )
         
-        return self.save(output_file)
+        return self
     
     def save(self, filename):
         self.doc.saveas(filename)
         return filename
+    
+    def to_bytes(self):
+        """Serialize the current document in memory, as save() would write it"""
+        stream = io.StringIO()
+        self.doc.write(stream)
+        return self.doc.encode(stream.getvalue())
 
 if __name__ == "__main__":
     # Test enhanced creator
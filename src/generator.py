@@ -1,107 +1,190 @@
 # src/generator.py - Enhanced version
+import functools
 import re
-import json
+from pathlib import Path
+
+from src import json_utils
+
+
+# Patterns are compiled once at import; parse_description runs them against
+# the lowercased description, so every literal in them must be lowercase.
+
+# Numeric fields, scanned in a single pass by _FIELD_SCANNER. Each pattern sits
+# inside a lookahead so matches can overlap ("4 holes 10mm diameter" holds both
+# a hole count and a hole diameter); keeping the first hit per field gives the
+# same result as a separate re.search per pattern.
+_WORD_LED_PATTERNS = {
+    # Dimensions
+    'rectangle': (r'rectangular?\s+(?:plate|bracket|frame)?\s*'
+                  r'(?P<rect_w>\d+)(?:mm)?\s*(?:by|x)\s*(?P<rect_h>\d+)(?:mm)?'),
+    'square': r'square\s+(?:plate|bracket)?\s*(?P<square_side>\d+)(?:mm)?',
+    'circular': r'(?:circular|circle)\s+(?:outer\s+)?diameter\s+(?P<outer_d>\d+)(?:mm)?',
+    'inner_diameter': r'inner\s+diameter\s+(?P<inner_d>\d+)(?:mm)?',
+
+    # Holes
+    'hole_diameter': r'holes?\s+(?P<hole_d>\d+)(?:mm)?\s+diameter',
+    'center_hole': r'center\s+hole\s+(?P<center_d>\d+)(?:mm)?\s+diameter',
+}
+_NUMBER_LED_PATTERNS = {
+    # Holes
+    'hole_count': r'(?P<holes_n>\d+)\s+(?:circular\s+)?(?:bolt\s+)?holes?',
+    'corner_offset': r'(?P<offset>\d+)(?:mm)?\s+(?:from|offset|at)\s+(?:each\s+)?corners?',
+    'pcd': r'(?P<pcd_d>\d+)(?:mm)?\s+(?:pitch\s+circle|pcd)',
+
+    # Features
+    'fillet': r'(?P<fillet_r>\d+)(?:mm)?\s+radius\s+fillet',
+}
+
+
+# Shape keywords, reported by the same scan as zero-capture markers. Only one
+# alternative is reported per offset, and the 'square' field starts with the
+# keyword, so a 'square' field match also marks the keyword.
+_SHAPE_KEYWORDS = {
+    'l_shaped': r'l-shaped',
+    't_shaped': r't-shaped',
+    'triangular_kw': r'triangular',
+    'flange_kw': r'flange',
+    'square_kw': r'square',
+}
+
+# Shape type for each marker, highest priority first
+_SHAPE_PRIORITY = (
+    ('l_shaped', 'l_bracket'),
+    ('t_shaped', 't_bracket'),
+    ('triangular_kw', 'triangular'),
+    ('flange_kw', 'flange'),
+    ('square_kw', 'square'),
+    ('square', 'square'),
+)
+
+
+def _lookaheads(patterns: dict) -> str:
+    return '|'.join(f'(?=(?P<{name}>{pattern}))' for name, pattern in patterns.items())
+
+
+def _leading_letters(patterns: dict) -> str:
+    """Character class of the letters the patterns must start with"""
+    letters = set()
+    for name, pattern in patterns.items():
+        # A plain leading letter, or a non-capturing group of plain alternatives
+        group = re.match(r'\(\?:([a-z\-|]+)\)(?![?*{])', pattern)
+        for alternative in group.group(1).split('|') if group else [pattern]:
+            if not alternative[:1].isalpha() or alternative[1:2] in ('?', '*', '{'):
+                raise ValueError(f"Pattern {name!r} must start with a literal letter: {pattern!r}")
+            letters.add(alternative[0])
+    return '[' + ''.join(sorted(letters)) + ']'
+
+
+def _check_digit_led(patterns: dict) -> dict:
+    """Make sure each pattern starts with a digit, as the scanner's guard assumes"""
+    for name, pattern in patterns.items():
+        if not re.match(r'(?:\(\?P<\w+>)?\\d', pattern):
+            raise ValueError(f"Pattern {name!r} must start with a digit: {pattern!r}")
+    return patterns
+
+
+# The guards keep the engine from trying every alternative at every offset:
+# number-led patterns only start on the first digit of a number (the leftmost
+# match always does), word-led ones only on their first letters. The letter
+# classes are derived from the patterns, so new patterns cannot be skipped.
+_FIELD_SCANNER = re.compile(
+    rf'(?<!\d)(?=\d)(?:{_lookaheads(_check_digit_led(_NUMBER_LED_PATTERNS))})'
+    rf'|(?={_leading_letters(_WORD_LED_PATTERNS)})(?:{_lookaheads(_WORD_LED_PATTERNS)})'
+    rf'|(?={_leading_letters(_SHAPE_KEYWORDS)})(?:{_lookaheads(_SHAPE_KEYWORDS)})'
+)
+
+# Cutouts
+_SLOT_RE = re.compile(r'slot\s+(\d+)(?:mm)?\s+by\s+(\d+)(?:mm)?')
+_CUTOUT_RE = re.compile(r'cutout\s+(\d+)(?:mm)?\s+(?:by|x|diameter)\s+(\d+)?(?:mm)?')
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_cached(desc: str) -> tuple:
+    """Parse a lowercased description into (field, value) pairs"""
+    result = {'type': 'unknown', 'features': ()}
+    
+    # First match of every numeric field and shape keyword, in one scan
+    found = {}
+    for m in _FIELD_SCANNER.finditer(desc):
+        found.setdefault(m.lastgroup, m)
+    
+    # Detect shape type
+    result['type'] = 'rectangular'
+    for marker, shape in _SHAPE_PRIORITY:
+        if marker in found:
+            result['type'] = shape
+            break
+    
+    # Parse dimensions
+    if result['type'] == 'rectangular' or result['type'] in ['l_bracket', 't_bracket']:
+        rect = found.get('rectangle')
+        if rect:
+            result['width'] = int(rect.group('rect_w'))
+            result['height'] = int(rect.group('rect_h'))
+    
+    if result['type'] == 'square':
+        square = found.get('square')
+        if square:
+            result['width'] = result['height'] = int(square.group('square_side'))
+    
+    if result['type'] == 'flange':
+        outer = found.get('circular')
+        inner = found.get('inner_diameter')
+        if outer:
+            result['outer_diameter'] = int(outer.group('outer_d'))
+        if inner:
+            result['inner_diameter'] = int(inner.group('inner_d'))
+    
+    # Parse holes
+    holes = found.get('hole_count')
+    if holes:
+        result['hole_count'] = int(holes.group('holes_n'))
+    
+    diameter = found.get('hole_diameter')
+    if diameter:
+        result['hole_diameter'] = int(diameter.group('hole_d'))
+    
+    # Center hole
+    center = found.get('center_hole')
+    if center:
+        result['center_hole_diameter'] = int(center.group('center_d'))
+    
+    # Offset
+    offset = found.get('corner_offset')
+    if offset:
+        result['corner_offset'] = int(offset.group('offset'))
+    
+    # PCD
+    pcd = found.get('pcd')
+    if pcd:
+        result['pcd'] = int(pcd.group('pcd_d'))
+    
+    # Fillet
+    fillet = found.get('fillet')
+    if fillet:
+        result['fillet_radius'] = int(fillet.group('fillet_r'))
+    
+    return tuple(result.items())
+
 
 class EnhancedTemplateGenerator:
-    def __init__(self):
-        self.patterns = {
-            # Dimensions
-            'rectangle': r'rectangular?\s+(?:plate|bracket|frame)?\s*(\d+)(?:mm)?\s*(?:by|x)\s*(\d+)(?:mm)?',
-            'square': r'square\s+(?:plate|bracket)?\s*(\d+)(?:mm)?',
-            'circular': r'(?:circular|circle)\s+(?:outer\s+)?diameter\s+(\d+)(?:mm)?',
-            'inner_diameter': r'inner\s+diameter\s+(\d+)(?:mm)?',
-            
-            # Holes
-            'hole_count': r'(\d+)\s+(?:circular\s+)?(?:bolt\s+)?holes?',
-            'hole_diameter': r'holes?\s+(\d+)(?:mm)?\s+diameter',
-            'corner_offset': r'(\d+)(?:mm)?\s+(?:from|offset|at)\s+(?:each\s+)?corners?',
-            'pcd': r'(\d+)(?:mm)?\s+(?:pitch\s+circle|PCD)',
-            'center_hole': r'center\s+hole\s+(\d+)(?:mm)?\s+diameter',
-            
-            # Shapes
-            'l_bracket': r'L-shaped',
-            't_bracket': r'T-shaped',
-            'triangular': r'triangular',
-            'fillet': r'(\d+)(?:mm)?\s+radius\s+fillet',
-            
-            # Cutouts
-            'slot': r'slot\s+(\d+)(?:mm)?\s+by\s+(\d+)(?:mm)?',
-            'cutout': r'cutout\s+(\d+)(?:mm)?\s+(?:by|x|diameter)\s+(\d+)?(?:mm)?'
-        }
-    
-    def parse_description(self, description):
-        desc = description.lower()
-        result = {'type': 'unknown', 'features': []}
-        
-        # Detect shape type
-        if re.search(self.patterns['l_bracket'], desc):
-            result['type'] = 'l_bracket'
-        elif re.search(self.patterns['t_bracket'], desc):
-            result['type'] = 't_bracket'
-        elif re.search(self.patterns['triangular'], desc):
-            result['type'] = 'triangular'
-        elif 'flange' in desc:
-            result['type'] = 'flange'
-        elif 'square' in desc:
-            result['type'] = 'square'
-        else:
-            result['type'] = 'rectangular'
-        
-        # Parse dimensions
-        if result['type'] == 'rectangular' or result['type'] in ['l_bracket', 't_bracket']:
-            rect = re.search(self.patterns['rectangle'], desc)
-            if rect:
-                result['width'] = int(rect.group(1))
-                result['height'] = int(rect.group(2))
-        
-        if result['type'] == 'square':
-            square = re.search(self.patterns['square'], desc)
-            if square:
-                result['width'] = result['height'] = int(square.group(1))
-        
-        if result['type'] == 'flange':
-            outer = re.search(self.patterns['circular'], desc)
-            inner = re.search(self.patterns['inner_diameter'], desc)
-            if outer:
-                result['outer_diameter'] = int(outer.group(1))
-            if inner:
-                result['inner_diameter'] = int(inner.group(1))
-        
-        # Parse holes
-        holes = re.search(self.patterns['hole_count'], desc)
-        if holes:
-            result['hole_count'] = int(holes.group(1))
-        
-        diameter = re.search(self.patterns['hole_diameter'], desc)
-        if diameter:
-            result['hole_diameter'] = int(diameter.group(1))
-        
-        # Center hole
-        center = re.search(self.patterns['center_hole'], desc)
-        if center:
-            result['center_hole_diameter'] = int(center.group(1))
-        
-        # Offset
-        offset = re.search(self.patterns['corner_offset'], desc)
-        if offset:
-            result['corner_offset'] = int(offset.group(1))
-        
-        # PCD
-        pcd = re.search(self.patterns['pcd'], desc)
-        if pcd:
-            result['pcd'] = int(pcd.group(1))
-        
-        # Fillet
-        fillet = re.search(self.patterns['fillet'], desc)
-        if fillet:
-            result['fillet_radius'] = int(fillet.group(1))
-        
+    # Stateless, the patterns are module-level compiled regexes
+    __slots__ = ()
+    
+    def parse_description(self, description: str) -> dict:
+        # Edge whitespace never affects a match, strip it so such variants share an entry
+        result = dict(_parse_cached(description.strip().lower()))
+        result['features'] = list(result['features'])
         return result
     
-    def test_parser(self, test_cases_file='data/test_cases.json'):
+    @staticmethod
+    def cache_clear():
+        """Drop all memoized parse results"""
+        _parse_cached.cache_clear()
+    
+    def test_parser(self, test_cases_file: str = 'data/test_cases.json') -> list:
         """Test parser on all test cases"""
-        with open(test_cases_file, 'r') as f:
-            data = json.load(f)
+        data = json_utils.loads(Path(test_cases_file).read_bytes())
         
         results = []
         for tc in data['test_cases']:
@@ -114,6 +197,10 @@ class EnhancedTemplateGenerator:
         
         return results
 
+
+# Parsing keeps no per-instance state, so one instance can be shared freely
+SHARED = EnhancedTemplateGenerator()
+
 if __name__ == "__main__":
     gen = EnhancedTemplateGenerator()
     
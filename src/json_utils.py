@@ -0,0 +1,75 @@
+"""
+src/json_utils.py - JSON helpers backed by orjson when it is installed.
+
+orjson is optional; without it the stdlib json module is used with the same
+output layout (2-space indent). orjson writes non-ASCII characters as raw
+UTF-8 where json.dumps escapes them to \\uXXXX, so documents containing any
+go through json.dumps and the output is always identical to the stdlib's.
+"""
+import json
+
+# Try to import optional dependencies
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj) -> str:
+    """
+    Serialize an object to an indented JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text indented by 2 spaces
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson.JSONEncodeError: types orjson rejects (e.g. non-str keys)
+            pass
+        else:
+            # ASCII-only output, so writing it to a non-UTF-8 stdout cannot fail
+            if text.isascii():
+                return text
+    return json.dumps(obj, indent=2)
+
+
+def dumps_bytes(obj) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON bytes, for writing to files.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON document indented by 2 spaces, UTF-8 encoded
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            if data.isascii():
+                return data
+    return json.dumps(obj, indent=2).encode()
+
+
+def loads(data):
+    """
+    Parse JSON text.
+
+    Args:
+        data: JSON document as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
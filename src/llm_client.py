@@ -5,36 +5,96 @@ Features:
 - Deterministic generation (do_sample=False, temperature=0.0, top_k=1, top_p=1.0)
 - Strict prompt instructing model to return exactly one JSON object
 - Balanced brace extractor for JSON parsing
+- Generation stops once the first JSON object closes
 - Schema validation via validator.validate_params
 - Fallback to rule-based parser if LLM fails
+- Batched extraction with left-padded prompts
 - Metadata in output (_source, raw_llm, validation_errors)
+- Exact-match LRU cache of validated LLM results per client
 """
+import copy
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+import re
+import sys
+from collections import OrderedDict
 from typing import Optional
 
-logger = logging.getLogger(__name__)
-
-# Try to import optional dependencies
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+from src import json_utils
+from src.validator import validate_params
+from src.generator import SHARED as _SHARED_PARSER
 
-try:
-    from transformers import AutoTokenizer, AutoModelForCausalLM
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-from src.validator import validate_params  # noqa: E402
-from src.generator import EnhancedTemplateGenerator  # noqa: E402
+# Optional dependencies; torch and transformers take seconds to import, so
+# they are only imported once a model is actually loaded
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
 
 # Default seed for reproducibility
 DEFAULT_SEED = 42
 
+# Weight formats accepted by LocalLLMClient(quantization=...)
+QUANTIZATION_MODES = ("fp16", "int8", "nf4")
+
+# Extraction prompt; {description} is the only placeholder
+PROMPT_TEMPLATE = """You are a CAD parameter extraction system. Extract parameters from the description below.
+
+IMPORTANT: Return EXACTLY ONE valid JSON object with no additional text, explanation, or examples.
+
+Valid JSON keys:
+- type: one of "rectangular", "square", "flange", "l_bracket", "t_bracket", "triangular"
+- width: number in mm (for rectangular/square plates)
+- height: number in mm (for rectangular/square plates)
+- outer_diameter: number in mm (for flanges)
+- inner_diameter: number in mm (for flanges)
+- hole_count: integer number of holes
+- hole_diameter: number in mm
+- corner_offset: number in mm (distance from corners)
+- center_hole_diameter: number in mm
+- pcd: number in mm (pitch circle diameter)
+- fillet_radius: number in mm
+
+Description: {description}
+
+JSON:"""
+
+# Fixed text around the description, tokenized once per client when possible
+_PROMPT_PREFIX, _PROMPT_SUFFIX = PROMPT_TEMPLATE.split("{description}")
+
+# Descriptions used to check that prompt pieces tokenize independently
+_PROMPT_CHECK_DESCRIPTIONS = ("rectangular plate 200mm by 100mm", "Flange, 8 holes on 150mm PCD.")
+
+# Decodes the JSON object at the first brace of the model output
+_JSON_DECODER = json.JSONDecoder()
+
+# Braces are the only characters the balanced extractor has to look at
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def _loads_bare_object(text: str) -> Optional[dict]:
+    """
+    Parse text that is a single JSON object apart from surrounding whitespace.
+
+    Uses orjson, which is faster than the stdlib decoder on small objects.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Parsed dict, or None if orjson is unavailable or text is anything else
+    """
+    if not json_utils.ORJSON_AVAILABLE or not text.lstrip().startswith('{'):
+        return None
+    try:
+        obj = json_utils.loads(text)
+    except ValueError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
 
 def _extract_json_balanced(text: str) -> Optional[str]:
     """
@@ -51,18 +111,73 @@ def _extract_json_balanced(text: str) -> Optional[str]:
     if start == -1:
         return None
 
+    # Jump from brace to brace in C instead of testing every character
     brace_count = 0
-    for i in range(start, len(text)):
-        if text[i] == '{':
+    for match in _BRACE_RE.finditer(text, start):
+        if match.group() == '{':
             brace_count += 1
-        elif text[i] == '}':
+        else:
             brace_count -= 1
             if brace_count == 0:
-                return text[start:i + 1]
+                return text[start:match.end()]
 
     return None
 
 
+class _BraceBalancedStop:
+    """
+    Stop generating a row once the first JSON object in its output closes.
+
+    The balanced extractor ignores everything after that object, so further
+    tokens are wasted decode steps. Only newly generated tokens are scanned.
+    Implements the transformers StoppingCriteria call protocol without
+    subclassing it, so defining it does not import transformers.
+    """
+
+    def __init__(self, tokenizer, batch_size: int = 1):
+        """
+        Args:
+            tokenizer: Tokenizer used to decode each new token
+            batch_size: Number of rows being generated
+        """
+        self.tokenizer = tokenizer
+        self.depth = [0] * batch_size
+        self.done = [False] * batch_size
+
+    def update(self, row: int, text: str) -> bool:
+        """
+        Feed newly generated text for a row.
+
+        Args:
+            row: Batch row the text belongs to
+            text: Decoded text of the new token(s)
+
+        Returns:
+            True once the row's first JSON object is closed
+        """
+        if self.done[row]:
+            return True
+
+        for match in _BRACE_RE.finditer(text):
+            if match.group() == '{':
+                self.depth[row] += 1
+            elif self.depth[row] > 0:
+                self.depth[row] -= 1
+                if self.depth[row] == 0:
+                    self.done[row] = True
+                    break
+
+        return self.done[row]
+
+    def __call__(self, input_ids, scores, **kwargs):
+        import torch
+
+        for row, token_id in enumerate(input_ids[:, -1].tolist()):
+            if not self.done[row]:
+                self.update(row, self.tokenizer.decode([token_id]))
+        return torch.tensor(self.done, dtype=torch.bool, device=input_ids.device)
+
+
 class LocalLLMClient:
     """
     Deterministic LLM client for CAD parameter extraction.
@@ -76,7 +191,10 @@ class LocalLLMClient:
         model_name: str = "codellama/CodeLlama-7b-Instruct-hf",
         seed: int = DEFAULT_SEED,
         max_new_tokens: int = 200,
-        load_model: bool = True
+        load_model: bool = True,
+        cache_size: int = 512,
+        quantization: str = "fp16",
+        compile_model: bool = False
     ):
         """
         Initialize the LLM client.
@@ -86,13 +204,30 @@ class LocalLLMClient:
             seed: Random seed for reproducibility
             max_new_tokens: Maximum tokens to generate
             load_model: If False, skip model loading (for testing)
+            cache_size: Number of validated LLM results kept in the cache (0 disables)
+            quantization: Weight format on CUDA, one of QUANTIZATION_MODES; fp16
+                loads unquantized half-precision weights (bfloat16 on Ampere
+                or newer GPUs), int8 and nf4 need bitsandbytes and fall back
+                to fp16 without it
+            compile_model: On CUDA, compile the forward pass with torch.compile
+                and a static KV cache (slower start-up, faster decoding)
         """
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"quantization must be one of {QUANTIZATION_MODES}, got {quantization!r}")
+
         self.model_name = model_name
         self.seed = seed
         self.max_new_tokens = max_new_tokens
+        self.quantization = quantization
+        self.compile_model = compile_model
         self.tokenizer = None
         self.model = None
-        self._fallback_parser = EnhancedTemplateGenerator()
+        # (prefix ids, suffix ids) of PROMPT_TEMPLATE, None to tokenize whole prompts
+        self._prompt_ids = None
+        self._fallback_parser = _SHARED_PARSER
+        # Greedy decoding is deterministic, so a repeated description gets the same answer
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
 
         if load_model:
             self._load_model()
@@ -109,18 +244,123 @@ class LocalLLMClient:
 
         logger.info(f"Loading model: {self.model_name}")
 
+        import torch
+        from transformers import AutoTokenizer, AutoModelForCausalLM
+
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.model_name,
-                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-                device_map="auto" if torch.cuda.is_available() else None
-            )
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+            # Batched prompts are left-padded so generation continues right after each one
+            self.tokenizer.padding_side = "left"
+            if self.tokenizer.pad_token is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
+            self._prompt_ids = self._split_prompt_ids()
+            model_kwargs = {
+                "torch_dtype": self._torch_dtype(),
+                "device_map": "auto" if torch.cuda.is_available() else None,
+                "quantization_config": self._quantization_config(),
+            }
+            self.model = None
+            if self._use_flash_attention():
+                try:
+                    self.model = AutoModelForCausalLM.from_pretrained(
+                        self.model_name,
+                        attn_implementation="flash_attention_2",
+                        **model_kwargs
+                    )
+                except (ImportError, ValueError) as e:
+                    logger.warning(f"FlashAttention-2 rejected, using default attention: {e}")
+            if self.model is None:
+                self.model = AutoModelForCausalLM.from_pretrained(self.model_name, **model_kwargs)
             logger.info("Model loaded successfully!")
+            # Seed once; greedy decoding is deterministic without re-seeding per call.
+            # Re-seed in _generate if sampling is ever enabled.
+            torch.manual_seed(self.seed)
+            if torch.cuda.is_available():
+                torch.cuda.manual_seed_all(self.seed)
+            if self.compile_model:
+                self._compile_model()
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
 
+    def _use_flash_attention(self) -> bool:
+        """Whether FlashAttention-2 can run: flash-attn installed and an Ampere or newer GPU."""
+        import torch
+
+        if not torch.cuda.is_available() or importlib.util.find_spec("flash_attn") is None:
+            return False
+        # The kernels need compute capability 8.0; on older GPUs every generate() would raise
+        major, _ = torch.cuda.get_device_capability()
+        if major < 8:
+            logger.info(f"flash-attn installed but GPU compute capability {major}.x < 8.0, using default attention")
+            return False
+        return True
+
+    def _torch_dtype(self):
+        """bfloat16 on Ampere or newer GPUs, float16 on older GPUs, float32 on CPU."""
+        import torch
+
+        if not torch.cuda.is_available():
+            return torch.float32
+        # is_bf16_supported() also counts emulated bf16 (T4, V100); only Ampere
+        # and newer have bf16 tensor cores, emulation decodes slower than fp16
+        major, _ = torch.cuda.get_device_capability()
+        if major >= 8:
+            return torch.bfloat16
+        return torch.float16
+
+    def _compile_model(self):
+        """Compile the forward pass with CUDA graphs and warm it up."""
+        import torch
+
+        if not torch.cuda.is_available():
+            logger.info("CUDA not available, skipping torch.compile")
+            return
+
+        eager_forward = self.model.forward
+        try:
+            # A static KV cache keeps decode shapes fixed so CUDA graphs can be replayed
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+            # Compile and capture now rather than during the first request
+            self._generate(self._build_prompt("rectangular plate 100mm by 50mm"))
+            logger.info("Model compiled")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using the eager model: {e}")
+            self.model.generation_config.cache_implementation = None
+            self.model.forward = eager_forward
+
+    def _quantization_config(self):
+        """
+        Build the bitsandbytes config for the requested quantization.
+
+        Returns:
+            BitsAndBytesConfig, or None to load unquantized weights
+        """
+        if self.quantization == "fp16":
+            return None
+
+        import torch
+
+        if not torch.cuda.is_available():
+            logger.warning(f"{self.quantization} quantization needs CUDA, loading unquantized weights")
+            return None
+
+        if importlib.util.find_spec("bitsandbytes") is None:
+            logger.warning(f"bitsandbytes not available, loading fp16 weights instead of {self.quantization}")
+            return None
+
+        from transformers import BitsAndBytesConfig
+
+        if self.quantization == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=self._torch_dtype()
+        )
+
     def _build_prompt(self, description: str) -> str:
         """
         Build a strict prompt for CAD parameter extraction.
@@ -131,26 +371,73 @@ class LocalLLMClient:
         Returns:
             Formatted prompt string
         """
-        return f"""You are a CAD parameter extraction system. Extract parameters from the description below.
+        return _PROMPT_PREFIX + description + _PROMPT_SUFFIX
 
-IMPORTANT: Return EXACTLY ONE valid JSON object with no additional text, explanation, or examples.
+    def _split_prompt_ids(self) -> Optional[tuple]:
+        """
+        Tokenize the fixed text around the description once.
 
-Valid JSON keys:
-- type: one of "rectangular", "square", "flange", "l_bracket", "t_bracket", "triangular"
-- width: number in mm (for rectangular/square plates)
-- height: number in mm (for rectangular/square plates)
-- outer_diameter: number in mm (for flanges)
-- inner_diameter: number in mm (for flanges)
-- hole_count: integer number of holes
-- hole_diameter: number in mm
-- corner_offset: number in mm (distance from corners)
-- center_hole_diameter: number in mm
-- pcd: number in mm (pitch circle diameter)
-- fillet_radius: number in mm
+        The pieces are only used if prefix + description + suffix ids
+        reproduce the tokenization of the full prompt for sample descriptions.
 
-Description: {description}
+        Returns:
+            (prefix ids, suffix ids), or None if the prompt has to be
+            tokenized whole
+        """
+        # The space before the description belongs to its first token
+        prefix_ids = self.tokenizer(_PROMPT_PREFIX.rstrip(" "))["input_ids"]
+        samples = list(_PROMPT_CHECK_DESCRIPTIONS)
+        description_ids = self.tokenizer(samples, add_special_tokens=False)["input_ids"]
+
+        full_ids = self.tokenizer(self._build_prompt(samples[0]))["input_ids"]
+        head = prefix_ids + description_ids[0]
+        if full_ids[:len(head)] != head:
+            logger.info("Prompt prefix does not tokenize independently, tokenizing whole prompts")
+            return None
+        suffix_ids = full_ids[len(head):]
+
+        for sample, ids in zip(samples[1:], description_ids[1:]):
+            if self.tokenizer(self._build_prompt(sample))["input_ids"] != prefix_ids + ids + suffix_ids:
+                logger.info("Prompt pieces do not tokenize independently, tokenizing whole prompts")
+                return None
+
+        return prefix_ids, suffix_ids
+
+    def _tokenize(self, prompts: list):
+        """
+        Tokenize prompts, left-padded to a common length.
 
-JSON:"""
+        Prompts built by _build_prompt reuse the cached prefix and suffix ids,
+        so only their descriptions are tokenized.
+
+        Args:
+            prompts: Input prompts
+
+        Returns:
+            BatchEncoding with input_ids and attention_mask tensors
+        """
+        if self._prompt_ids is None or not all(
+            p.startswith(_PROMPT_PREFIX) and p.endswith(_PROMPT_SUFFIX)
+            and len(p) >= len(_PROMPT_PREFIX) + len(_PROMPT_SUFFIX)
+            for p in prompts
+        ):
+            return self.tokenizer(prompts, return_tensors="pt", padding=True)
+
+        from transformers import BatchEncoding
+
+        prefix_ids, suffix_ids = self._prompt_ids
+        descriptions = [p[len(_PROMPT_PREFIX):len(p) - len(_PROMPT_SUFFIX)] for p in prompts]
+        rows = [
+            prefix_ids + ids + suffix_ids
+            for ids in self.tokenizer(descriptions, add_special_tokens=False)["input_ids"]
+        ]
+
+        width = max(len(row) for row in rows)
+        pad_id = self.tokenizer.pad_token_id
+        return BatchEncoding({
+            "input_ids": [[pad_id] * (width - len(row)) + row for row in rows],
+            "attention_mask": [[0] * (width - len(row)) + [1] * len(row) for row in rows]
+        }, tensor_type="pt")
 
     def _generate(self, prompt: str) -> str:
         """
@@ -162,24 +449,34 @@ JSON:"""
         Returns:
             Generated text (only new tokens, prompt excluded)
         """
+        # A batch of one, so the generation settings live only in _generate_batch
+        return self._generate_batch([prompt])[0]
+
+    def _generate_batch(self, prompts: list) -> list:
+        """
+        Generate text for several prompts in one batched generate call.
+
+        Prompts are left-padded, so every row's new tokens start at the same
+        position and can be sliced off together.
+
+        Args:
+            prompts: Input prompts
+
+        Returns:
+            Generated texts (only new tokens, prompts excluded), one per prompt
+        """
         if self.model is None or self.tokenizer is None:
             raise RuntimeError("Model not loaded. Call _load_model() or initialize with load_model=True")
 
-        # Set seed for reproducibility
-        if TORCH_AVAILABLE:
-            torch.manual_seed(self.seed)
-            if torch.cuda.is_available():
-                torch.cuda.manual_seed_all(self.seed)
+        import torch
+        from transformers import StoppingCriteriaList
 
         # Tokenize input
-        inputs = self.tokenizer(prompt, return_tensors="pt")
-        if self.model.device.type != "cpu":
-            inputs = {k: v.to(self.model.device) for k, v in inputs.items()}
-
-        prompt_length = inputs["input_ids"].shape[1]
+        inputs = self._tokenize(prompts).to(self.model.device)
+        prompt_length = inputs.input_ids.shape[1]
 
         # Generate with deterministic settings
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.model.generate(
                 **inputs,
                 max_new_tokens=self.max_new_tokens,
@@ -187,19 +484,19 @@ JSON:"""
                 temperature=0.0,
                 top_k=1,
                 top_p=1.0,
-                pad_token_id=self.tokenizer.eos_token_id
+                pad_token_id=self.tokenizer.pad_token_id,
+                stopping_criteria=StoppingCriteriaList([_BraceBalancedStop(self.tokenizer, len(prompts))])
             )
 
-        # Decode only generated tokens (exclude prompt)
-        generated_tokens = outputs[0][prompt_length:]
-        result = self.tokenizer.decode(generated_tokens, skip_special_tokens=True)
-
-        return result
+        return self.tokenizer.batch_decode(outputs[:, prompt_length:], skip_special_tokens=True)
 
     def extract_parameters(self, description: str) -> dict:
         """
         Extract CAD parameters from a natural language description.
 
+        Descriptions the model already answered with valid parameters are
+        served from the client's LRU cache without running it again.
+
         Args:
             description: Natural language CAD description
 
@@ -209,59 +506,169 @@ JSON:"""
             - raw_llm: Raw LLM output (only on debug/failure)
             - validation_errors: List of validation errors (if any)
         """
-        result = {
-            "_source": "fallback_parser",
-            "validation_errors": []
-        }
+        key = self._cache_key(description)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-        # Try LLM extraction if model is available
-        if self.model is not None and self.tokenizer is not None:
-            prompt = self._build_prompt(description)
+        result = self._extract_parameters(description)
+        self._cache_put(key, result)
+        return result
 
-            try:
-                raw_output = self._generate(prompt)
-                logger.debug(f"Raw LLM output: {raw_output[:500]}")
-
-                # Extract JSON from output
-                json_str = _extract_json_balanced(raw_output)
-
-                if json_str is None:
-                    logger.warning("No JSON object found in LLM output")
-                    result["raw_llm"] = raw_output[:500]
-                    result["validation_errors"].append("No JSON object found in LLM output")
-                else:
-                    try:
-                        params = json.loads(json_str)
-
-                        # Validate parsed params
-                        is_valid, errors = validate_params(params)
-
-                        if is_valid:
-                            # Success! Return LLM result
-                            params["_source"] = "llm"
-                            params["validation_errors"] = []
-                            return params
-                        else:
-                            logger.warning(f"LLM output failed validation: {errors}")
-                            result["raw_llm"] = raw_output[:500]
-                            result["validation_errors"] = errors
-
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON from LLM: {e}")
-                        result["raw_llm"] = raw_output[:500]
-                        result["validation_errors"].append(f"JSON decode error: {str(e)}")
+    def extract_parameters_batch(self, descriptions: list) -> list:
+        """
+        Extract CAD parameters for several descriptions with one generate call.
 
-            except Exception as e:
-                logger.error(f"LLM extraction failed: {e}")
-                result["validation_errors"].append(f"LLM error: {str(e)}")
+        Cache hits and repeated descriptions are not sent to the model. Each
+        result is post-processed exactly as in extract_parameters.
+
+        Args:
+            descriptions: Natural language CAD descriptions
+
+        Returns:
+            List of parameter dictionaries, in the order of descriptions
+        """
+        results = [None] * len(descriptions)
+        pending = {}
+        for i, description in enumerate(descriptions):
+            cached = self._cache_get(self._cache_key(description))
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(description, []).append(i)
+
+        if not pending:
+            return results
+
+        todo = list(pending)
+        if self.model is None or self.tokenizer is None:
+            logger.info("Model not available, using fallback parser")
+            extracted = [self._fallback(description) for description in todo]
         else:
+            try:
+                raw_outputs = self._generate_batch([self._build_prompt(d) for d in todo])
+            except Exception as e:
+                logger.error(f"LLM batch extraction failed: {e}")
+                extracted = [self._fallback(d, [f"LLM error: {str(e)}"]) for d in todo]
+            else:
+                extracted = [self._params_from_output(d, raw) for d, raw in zip(todo, raw_outputs)]
+
+        for description, result in zip(todo, extracted):
+            self._cache_put(self._cache_key(description), result)
+            indices = pending[description]
+            results[indices[0]] = result
+            for i in indices[1:]:
+                results[i] = copy.deepcopy(result)
+
+        return results
+
+    def _cache_key(self, description: str) -> bytes:
+        """Fixed-size cache key for a description under this client's model."""
+        data = f"{self.model_name}\0{description}".encode()
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[dict]:
+        """Copy of a cached result, or None on a miss."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(key)
+        # Callers modify the result (e.g. validation_errors), keep the cached one intact
+        return copy.deepcopy(cached)
+
+    def _cache_put(self, key: bytes, result: dict):
+        """Store a copy of a validated LLM result."""
+        # Fallback results are not cached: the template parser is memoized itself
+        # and a failed generation may succeed on a later call
+        if result["_source"] != "llm" or self.cache_size <= 0:
+            return
+        self._cache[key] = copy.deepcopy(result)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _extract_parameters(self, description: str) -> dict:
+        """Uncached implementation of extract_parameters."""
+        # Try LLM extraction if model is available
+        if self.model is None or self.tokenizer is None:
             logger.info("Model not available, using fallback parser")
+            return self._fallback(description)
+
+        try:
+            raw_output = self._generate(self._build_prompt(description))
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return self._fallback(description, [f"LLM error: {str(e)}"])
+
+        return self._params_from_output(description, raw_output)
+
+    def _params_from_output(self, description: str, raw_output: str) -> dict:
+        """
+        Turn raw model output into validated parameters.
+
+        Args:
+            description: Description the output was generated for
+            raw_output: Generated text
+
+        Returns:
+            LLM parameters if they parse and validate, the fallback result otherwise
+        """
+        logger.debug(f"Raw LLM output: {raw_output[:500]}")
 
-        # Fallback to rule-based parser
+        # Generation stops at the closing brace, so the output is usually the bare object
+        params = _loads_bare_object(raw_output)
+
+        # Otherwise decode the object starting at the first brace in one C-level pass
+        start = raw_output.find('{')
+        if params is None and start != -1:
+            try:
+                params, _ = _JSON_DECODER.raw_decode(raw_output, start)
+            except json.JSONDecodeError as e:
+                # An object that never closes counts as no JSON at all
+                if _extract_json_balanced(raw_output) is not None:
+                    logger.warning(f"Failed to parse JSON from LLM: {e}")
+                    return self._fallback(description, [f"JSON decode error: {str(e)}"], raw_output)
+
+        if params is None:
+            logger.warning("No JSON object found in LLM output")
+            return self._fallback(description, ["No JSON object found in LLM output"], raw_output)
+
+        # Decoded strings are fresh objects; interning lets the VALID_TYPES lookup match by identity
+        if isinstance(params, dict) and type(params.get("type")) is str:
+            params["type"] = sys.intern(params["type"])
+
+        # Validate parsed params
+        is_valid, errors = validate_params(params)
+        if not is_valid:
+            logger.warning(f"LLM output failed validation: {errors}")
+            return self._fallback(description, errors, raw_output)
+
+        # Success! Return LLM result
+        params["_source"] = "llm"
+        params["validation_errors"] = []
+        return params
+
+    def _fallback(self, description: str, errors: list = (), raw_output: Optional[str] = None) -> dict:
+        """
+        Parse a description with the rule-based parser.
+
+        Args:
+            description: Natural language CAD description
+            errors: Reasons the LLM result was not used
+            raw_output: Rejected model output, kept truncated as raw_llm
+
+        Returns:
+            Fallback parameters with _source and validation_errors metadata
+        """
         logger.info("Falling back to rule-based parser")
-        fallback_result = self._fallback_parser.parse_description(description)
+        result = {
+            "_source": "fallback_parser",
+            "validation_errors": list(errors)
+        }
+        if raw_output is not None:
+            result["raw_llm"] = raw_output[:500]
 
         # Merge fallback result with metadata
+        fallback_result = self._fallback_parser.parse_description(description)
         for key, value in fallback_result.items():
             if key not in ("_source", "validation_errors", "raw_llm"):
                 result[key] = value
@@ -301,10 +708,11 @@ if __name__ == "__main__":
         "circular flange outer diameter 200mm inner diameter 100mm with 8 bolt holes"
     ]
 
-    for i, test in enumerate(test_cases, 1):
+    results = client.extract_parameters_batch(test_cases)
+
+    for i, (test, result) in enumerate(zip(test_cases, results), 1):
         print(f"\n{'=' * 60}")
         print(f"Test {i}: {test}")
-        result = client.extract_parameters(test)
         print(f"Source: {result.get('_source', 'unknown')}")
         print(f"Result: {json.dumps(result, indent=2)}")
 
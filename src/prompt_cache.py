@@ -0,0 +1,199 @@
+"""
+src/prompt_cache.py - Exact and semantic caches for parameter extraction results.
+
+Features:
+- Exact-match LRU keyed on the normalized description and parser type
+- Optional semantic tier using sentence-transformer embeddings and cosine similarity
+- Semantic hits require both descriptions to have the same numbers and
+  content words in the same order, so "200mm by 100mm" never reuses the
+  result cached for "200mm by 150mm", "4 holes" never reuses the one for
+  "4 slots", and swapping "inner" and "outer" between two diameters misses
+- Cached values are deep-copied on the way in and out, callers may mutate them
+- Safe to share between threads (e.g. Streamlit sessions)
+"""
+import copy
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+_TOKEN_RE = re.compile(r'\d+(?:\.\d+)?|[a-z]+(?:-[a-z]+)*')
+
+# Words that never change the part; any other word must match for a semantic hit,
+# so words missing from this list make the cache miss rather than return the wrong part
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "with", "and", "of", "at", "on", "in", "by", "x", "mm",
+    "each", "from", "to", "please", "make", "create", "draw", "me", "i", "need", "want",
+})
+
+
+def normalize_description(description: str) -> str:
+    """Lowercase a description and collapse runs of whitespace."""
+    return " ".join(description.lower().split())
+
+
+def load_sentence_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> Optional[Callable]:
+    """
+    Load a sentence-transformer model for the semantic cache tier.
+
+    Args:
+        model_name: HuggingFace sentence-transformers model identifier
+
+    Returns:
+        Callable mapping text to a unit-length embedding, or None if
+        sentence-transformers is not installed or the model fails to load
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.info("sentence-transformers not available, semantic cache disabled")
+        return None
+
+    try:
+        model = SentenceTransformer(model_name)
+    except Exception as e:
+        logger.warning(f"Failed to load embedding model {model_name}: {e}")
+        return None
+
+    def embed(text: str):
+        return model.encode(text, normalize_embeddings=True)
+
+    return embed
+
+
+class PromptCache:
+    """
+    Two-tier cache for extraction results.
+
+    The exact tier is an LRU keyed on (normalized description, parser type).
+    When an embedder is supplied, misses fall through to a semantic lookup
+    restricted to cached descriptions with the same parser type and the same
+    sequence of numbers and content words; the closest one is returned if its
+    cosine similarity reaches the threshold. Embeddings only decide between
+    wordings that differ in filler words.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        embedder: Optional[Callable] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached descriptions
+            embedder: Callable returning a unit-length embedding for a text,
+                or None to use the exact tier only
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.maxsize = maxsize
+        self.embedder = embedder
+        self.threshold = threshold
+        self._exact = OrderedDict()
+        self._semantic = {}
+        self._last_embedding = (None, None)
+        # Guards the LRU order, the buckets and the embedding memo across threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._exact)
+
+    def _embed(self, normalized: str):
+        # get() followed by put() for the same miss embeds the same text twice
+        text, vector = self._last_embedding
+        if text != normalized:
+            vector = self.embedder(normalized)
+            self._last_embedding = (normalized, vector)
+        return vector
+
+    @staticmethod
+    def _bucket_key(normalized: str, parser_type: str) -> tuple:
+        # Ordered, so each number stays attached to the words around it
+        tokens = tuple(t for t in _TOKEN_RE.findall(normalized) if t not in _FILLER_WORDS)
+        return parser_type, tokens
+
+    def get(self, description: str, parser_type: str) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            description: Natural language CAD description
+            parser_type: Parser mode the result was produced with
+
+        Returns:
+            Copy of the cached value, or None on a miss
+        """
+        normalized = normalize_description(description)
+        key = (normalized, parser_type)
+
+        with self._lock:
+            if key in self._exact:
+                self._exact.move_to_end(key)
+                return copy.deepcopy(self._exact[key])
+
+            if self.embedder is None:
+                return None
+
+            bucket = self._semantic.get(self._bucket_key(normalized, parser_type))
+            if not bucket:
+                return None
+
+            vector = self._embed(normalized)
+            best_text, best_score = None, self.threshold
+            for text, cached_vector in bucket.items():
+                score = float(vector @ cached_vector)
+                if score >= best_score:
+                    best_text, best_score = text, score
+
+            if best_text is None:
+                return None
+
+            logger.debug(f"Semantic cache hit ({best_score:.3f}): {best_text!r}")
+            hit_key = (best_text, parser_type)
+            self._exact.move_to_end(hit_key)
+            return copy.deepcopy(self._exact[hit_key])
+
+    def put(self, description: str, parser_type: str, value: Any) -> None:
+        """
+        Store a result.
+
+        Args:
+            description: Natural language CAD description
+            parser_type: Parser mode the result was produced with
+            value: Result to cache (stored as a deep copy)
+        """
+        normalized = normalize_description(description)
+        key = (normalized, parser_type)
+
+        with self._lock:
+            self._exact[key] = copy.deepcopy(value)
+            self._exact.move_to_end(key)
+
+            if self.embedder is not None:
+                bucket = self._semantic.setdefault(self._bucket_key(normalized, parser_type), {})
+                bucket[normalized] = self._embed(normalized)
+
+            while len(self._exact) > self.maxsize:
+                (old_text, old_type), _ = self._exact.popitem(last=False)
+                bucket_key = self._bucket_key(old_text, old_type)
+                bucket = self._semantic.get(bucket_key)
+                if bucket is not None:
+                    bucket.pop(old_text, None)
+                    if not bucket:
+                        del self._semantic[bucket_key]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+            self._last_embedding = (None, None)
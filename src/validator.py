@@ -1,12 +1,27 @@
 """
 src/validator.py - Schema validator for CAD parameters.
 
-Uses jsonschema if available; otherwise performs conservative type checks.
+Uses fastjsonschema or jsonschema if available; otherwise performs
+conservative type checks.
 """
 import logging
+import sys
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import jsonschema
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
 # CAD parameters JSON schema
 CAD_PARAMS_SCHEMA = {
     "type": "object",
@@ -31,24 +46,51 @@ CAD_PARAMS_SCHEMA = {
     "additionalProperties": True
 }
 
-# Valid shape types
-VALID_TYPES = {"rectangular", "square", "flange", "l_bracket", "t_bracket", "triangular", "unknown"}
+# Built once, jsonschema.validate would check the schema and build a validator per call
+_SCHEMA_VALIDATOR = jsonschema.Draft7Validator(CAD_PARAMS_SCHEMA) if JSONSCHEMA_AVAILABLE else None
+
+# fastjsonschema generates a plain Python function specialized to the schema
+_FAST_VALIDATE = fastjsonschema.compile(CAD_PARAMS_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+
+# Valid shape types, interned so lookups of interned strings match by identity
+VALID_TYPES = frozenset(
+    sys.intern(t) for t in ("rectangular", "square", "flange", "l_bracket", "t_bracket", "triangular", "unknown")
+)
+
+# Conservative checks per optional field: (accepted types, description, must be non-negative).
+# Read-only so no caller can change validation for everyone else.
+_NUMBER = (int, float)
+_FIELD_SPECS = MappingProxyType({
+    "width": (_NUMBER, "a number", True),
+    "height": (_NUMBER, "a number", True),
+    "outer_diameter": (_NUMBER, "a number", True),
+    "inner_diameter": (_NUMBER, "a number", True),
+    "hole_diameter": (_NUMBER, "a number", True),
+    "corner_offset": (_NUMBER, "a number", True),
+    "center_hole_diameter": (_NUMBER, "a number", True),
+    "pcd": (_NUMBER, "a number", True),
+    "fillet_radius": (_NUMBER, "a number", True),
+    "hole_count": (int, "an integer", True),
+    "features": (list, "a list", False),
+})
+
+
+def _validate_with_fastjsonschema(params: dict) -> tuple[bool, list[str]]:
+    """Validate params using the generated fastjsonschema function."""
+    try:
+        _FAST_VALIDATE(params)
+        return True, []
+    except fastjsonschema.JsonSchemaException as e:
+        # fastjsonschema stops at the first error; jsonschema reports all of them
+        if JSONSCHEMA_AVAILABLE:
+            return _validate_with_jsonschema(params)
+        return False, [e.message]
 
 
 def _validate_with_jsonschema(params: dict) -> tuple[bool, list[str]]:
     """Validate params using jsonschema library."""
-    import jsonschema
-
-    errors = []
-    try:
-        jsonschema.validate(instance=params, schema=CAD_PARAMS_SCHEMA)
-        return True, []
-    except jsonschema.ValidationError as e:
-        errors.append(str(e.message))
-        return False, errors
-    except jsonschema.SchemaError as e:
-        errors.append(f"Schema error: {e.message}")
-        return False, errors
+    errors = [error.message for error in _SCHEMA_VALIDATOR.iter_errors(params)]
+    return len(errors) == 0, errors
 
 
 def _validate_conservative(params: dict) -> tuple[bool, list[str]]:
@@ -69,34 +111,16 @@ def _validate_conservative(params: dict) -> tuple[bool, list[str]]:
         elif shape_type not in VALID_TYPES:
             errors.append(f"Invalid type '{shape_type}'. Must be one of: {', '.join(sorted(VALID_TYPES))}")
 
-    # Check numeric fields
-    numeric_fields = [
-        "width", "height", "outer_diameter", "inner_diameter",
-        "hole_diameter", "corner_offset", "center_hole_diameter",
-        "pcd", "fillet_radius"
-    ]
-    for field in numeric_fields:
-        if field in params:
-            value = params[field]
-            if not isinstance(value, (int, float)):
-                errors.append(f"Field '{field}' must be a number, got {type(value).__name__}")
-            elif value < 0:
-                errors.append(f"Field '{field}' must be non-negative, got {value}")
-
-    # Check integer fields
-    integer_fields = ["hole_count"]
-    for field in integer_fields:
-        if field in params:
-            value = params[field]
-            if not isinstance(value, int):
-                errors.append(f"Field '{field}' must be an integer, got {type(value).__name__}")
-            elif value < 0:
-                errors.append(f"Field '{field}' must be non-negative, got {value}")
-
-    # Check features array
-    if "features" in params:
-        if not isinstance(params["features"], list):
-            errors.append(f"Field 'features' must be a list, got {type(params['features']).__name__}")
+    # Check numeric, integer and array fields in one pass over the keys present
+    for field, value in params.items():
+        spec = _FIELD_SPECS.get(field)
+        if spec is None:
+            continue
+        types, kind, non_negative = spec
+        if not isinstance(value, types):
+            errors.append(f"Field '{field}' must be {kind}, got {type(value).__name__}")
+        elif non_negative and value < 0:
+            errors.append(f"Field '{field}' must be non-negative, got {value}")
 
     return len(errors) == 0, errors
 
@@ -113,23 +137,27 @@ def validate_params(params: dict) -> tuple[bool, list[str]]:
         - is_valid: bool indicating if params pass validation
         - errors: list of validation error messages (empty if valid)
     """
-    if params is None:
-        return False, ["params cannot be None"]
+    # Plain dicts skip both checks; None and subclasses take the slow path
+    if type(params) is not dict:
+        if params is None:
+            return False, ["params cannot be None"]
 
-    if not isinstance(params, dict):
-        return False, [f"params must be a dictionary, got {type(params).__name__}"]
+        if not isinstance(params, dict):
+            return False, [f"params must be a dictionary, got {type(params).__name__}"]
 
     # Check for error responses from previous parsing steps
     if "error" in params:
         return False, [f"params contains error: {params.get('error')}"]
 
-    try:
-        # Try jsonschema first
-        import jsonschema  # noqa: F401
+    # Try the schema validators first
+    if FASTJSONSCHEMA_AVAILABLE:
+        return _validate_with_fastjsonschema(params)
+
+    if JSONSCHEMA_AVAILABLE:
         return _validate_with_jsonschema(params)
-    except ImportError:
-        logger.debug("jsonschema not available, using conservative validation")
-        return _validate_conservative(params)
+
+    logger.debug("jsonschema not available, using conservative validation")
+    return _validate_conservative(params)
 
 
 if __name__ == "__main__":
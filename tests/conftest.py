@@ -0,0 +1,18 @@
+"""
+tests/conftest.py - Shared fixtures.
+"""
+import pytest
+
+from src.llm_client import LocalLLMClient
+
+
+@pytest.fixture(scope="session")
+def fallback_client():
+    """One model-less client for tests that only exercise the fallback path."""
+    return LocalLLMClient(load_model=False)
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """One output directory for the session; tests pick unique file names in it."""
+    return tmp_path_factory.mktemp("cli_outputs")
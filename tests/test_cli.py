@@ -1,9 +1,13 @@
 """
 tests/test_cli.py - Unit tests for the CLI module.
 
-Uses tmp_path fixture to test file output functionality.
+Uses the session-scoped shared_tmp fixture with unique file names to test
+file output functionality.
 """
 import json
+import uuid
+
+import pytest
 
 from src.cli import main, EXIT_SUCCESS
 
@@ -11,61 +15,42 @@ from src.cli import main, EXIT_SUCCESS
 class TestCLIBasic:
     """Basic CLI functionality tests."""
 
-    def test_force_fallback_outputs_json(self, capsys):
-        """Test --force-fallback produces JSON output."""
-        exit_code = main([
-            "--force-fallback",
-            "rectangular plate 200mm by 100mm with 4 holes"
-        ])
-
-        assert exit_code == EXIT_SUCCESS
-        captured = capsys.readouterr()
-        output = json.loads(captured.out)
-
-        assert output["_source"] == "fallback_parser"
-        assert output["type"] == "rectangular"
-        assert output["width"] == 200
-        assert output["height"] == 100
-
-    def test_force_fallback_square_plate(self, capsys):
-        """Test --force-fallback with square plate description."""
-        exit_code = main([
-            "--force-fallback",
-            "square plate 150mm by 150mm with center hole 30mm diameter"
-        ])
-
-        assert exit_code == EXIT_SUCCESS
-        captured = capsys.readouterr()
-        output = json.loads(captured.out)
-
-        assert output["type"] == "square"
-        assert output["width"] == 150
-        assert output["height"] == 150
-        assert output["center_hole_diameter"] == 30
-
-    def test_force_fallback_flange(self, capsys):
-        """Test --force-fallback with flange description."""
-        exit_code = main([
-            "--force-fallback",
-            "circular flange outer diameter 200mm inner diameter 100mm with 8 bolt holes"
-        ])
+    @pytest.mark.parametrize("description, expected", [
+        pytest.param(
+            "rectangular plate 200mm by 100mm with 4 holes",
+            {"_source": "fallback_parser", "type": "rectangular", "width": 200, "height": 100},
+            id="rectangular"
+        ),
+        pytest.param(
+            "square plate 150mm by 150mm with center hole 30mm diameter",
+            {"type": "square", "width": 150, "height": 150, "center_hole_diameter": 30},
+            id="square"
+        ),
+        # Note: Parser may not capture all fields depending on regex patterns
+        pytest.param(
+            "circular flange outer diameter 200mm inner diameter 100mm with 8 bolt holes",
+            {"type": "flange", "inner_diameter": 100, "hole_count": 8},
+            id="flange"
+        ),
+    ])
+    def test_force_fallback_outputs_json(self, capsys, description, expected):
+        """Test --force-fallback produces JSON output with the parsed fields."""
+        exit_code = main(["--force-fallback", description])
 
         assert exit_code == EXIT_SUCCESS
         captured = capsys.readouterr()
         output = json.loads(captured.out)
 
-        assert output["type"] == "flange"
-        # Note: Parser may not capture all fields depending on regex patterns
-        assert output["inner_diameter"] == 100
-        assert output["hole_count"] == 8
+        for key, value in expected.items():
+            assert output[key] == value, key
 
 
 class TestCLIFileOutput:
     """Test CLI file output functionality."""
 
-    def test_output_json_file(self, tmp_path, capsys):
+    def test_output_json_file(self, shared_tmp, capsys):
         """Test --output-json writes JSON to file."""
-        output_file = tmp_path / "output.json"
+        output_file = shared_tmp / f"output_{uuid.uuid4().hex}.json"
 
         exit_code = main([
             "--force-fallback",
@@ -83,9 +68,9 @@ class TestCLIFileOutput:
         assert data["width"] == 200
         assert data["height"] == 100
 
-    def test_output_json_creates_directories(self, tmp_path, capsys):
+    def test_output_json_creates_directories(self, shared_tmp, capsys):
         """Test --output-json creates parent directories."""
-        output_file = tmp_path / "nested" / "dir" / "output.json"
+        output_file = shared_tmp / f"nested_{uuid.uuid4().hex}" / "dir" / "output.json"
 
         exit_code = main([
             "--force-fallback",
@@ -96,9 +81,9 @@ class TestCLIFileOutput:
         assert exit_code == EXIT_SUCCESS
         assert output_file.exists()
 
-    def test_output_dxf_file(self, tmp_path, capsys):
+    def test_output_dxf_file(self, shared_tmp, capsys):
         """Test --output-dxf creates DXF file."""
-        output_file = tmp_path / "output.dxf"
+        output_file = shared_tmp / f"output_{uuid.uuid4().hex}.dxf"
 
         exit_code = main([
             "--force-fallback",
@@ -110,13 +95,13 @@ class TestCLIFileOutput:
         assert output_file.exists()
 
         # Check DXF file has content
-        content = output_file.read_bytes()
-        assert len(content) > 0
+        assert output_file.stat().st_size > 0
 
-    def test_output_both_json_and_dxf(self, tmp_path, capsys):
+    def test_output_both_json_and_dxf(self, shared_tmp, capsys):
         """Test creating both JSON and DXF outputs."""
-        json_file = tmp_path / "output.json"
-        dxf_file = tmp_path / "output.dxf"
+        stem = f"output_{uuid.uuid4().hex}"
+        json_file = shared_tmp / f"{stem}.json"
+        dxf_file = shared_tmp / f"{stem}.dxf"
 
         exit_code = main([
             "--force-fallback",
@@ -0,0 +1,57 @@
+"""
+tests/test_conversation_manager.py - Unit tests for ConversationManager.
+"""
+import json
+
+from src.conversation_manager import ConversationManager
+
+
+class TestUndo:
+    """Test cases for design updates and undo."""
+
+    def test_first_design_cannot_be_undone(self):
+        """Test undo needs at least two updates."""
+        mgr = ConversationManager()
+        assert mgr.undo() is False
+        mgr.update_design({"type": "rectangular", "width": 200})
+        assert mgr.undo() is False
+        assert mgr.current_design == {"type": "rectangular", "width": 200}
+
+    def test_undo_restores_changed_and_removes_added_keys(self):
+        """Test undo reverts overwritten values and drops new keys."""
+        mgr = ConversationManager()
+        mgr.update_design({"type": "rectangular", "width": 200})
+        mgr.update_design({"width": 250, "height": 100})
+        assert mgr.undo() is True
+        assert mgr.current_design == {"type": "rectangular", "width": 200}
+
+    def test_undo_steps_back_one_update_at_a_time(self):
+        """Test repeated undo walks back through the history."""
+        mgr = ConversationManager()
+        mgr.update_design({"type": "rectangular"})
+        mgr.update_design({"width": 200})
+        mgr.update_design({"width": 300, "hole_count": 4})
+        assert mgr.undo() is True
+        assert mgr.current_design == {"type": "rectangular", "width": 200}
+        assert mgr.undo() is True
+        assert mgr.current_design == {"type": "rectangular"}
+        assert mgr.undo() is False
+
+    def test_summary_is_current_design_json(self):
+        """Test get_summary reflects undo."""
+        mgr = ConversationManager()
+        mgr.update_design({"type": "square", "width": 150})
+        mgr.update_design({"width": 160})
+        mgr.undo()
+        assert json.loads(mgr.get_summary()) == {"type": "square", "width": 150}
+
+
+class TestContext:
+    """Test cases for message history."""
+
+    def test_get_context_uses_last_n_messages(self):
+        """Test only the most recent messages are included."""
+        mgr = ConversationManager()
+        for i in range(5):
+            mgr.add_message("user", f"message {i}")
+        assert mgr.get_context(last_n=2) == "Recent conversation:\nuser: message 3\nuser: message 4\n"
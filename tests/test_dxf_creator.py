@@ -0,0 +1,112 @@
+"""
+tests/test_dxf_creator.py - Unit tests for the DXF creator.
+"""
+import io
+import sys
+
+import ezdxf
+import numpy as np
+import pytest
+
+from src import dxf_creator
+from src.dxf_creator import EnhancedDXFCreator, HOLE_BLOCK
+
+RECT_PARAMS = {
+    "type": "rectangular",
+    "width": 200,
+    "height": 100,
+    "hole_diameter": 10,
+    "corner_offset": 20,
+    "center_hole_diameter": 30,
+}
+
+FLANGE_PARAMS = {
+    "type": "flange",
+    "outer_diameter": 200,
+    "inner_diameter": 100,
+    "hole_count": 8,
+    "hole_diameter": 15,
+    "pcd": 150,
+}
+
+
+@pytest.fixture
+def read_back(tmp_path):
+    """Write params through a creator and return the re-read modelspace."""
+    def _read_back(creator, params):
+        output_file = tmp_path / "out.dxf"
+        creator.create_from_params(params, str(output_file))
+        return ezdxf.readfile(str(output_file)).modelspace()
+    return _read_back
+
+
+class TestHoles:
+    """Test hole placement as circles and as block references."""
+
+    def test_corner_and_center_holes_as_circles(self, read_back):
+        """Test the default creator draws holes as CIRCLE entities."""
+        msp = read_back(EnhancedDXFCreator(), RECT_PARAMS)
+        circles = msp.query("CIRCLE")
+        assert len(msp.query("LWPOLYLINE")) == 1
+        assert sorted((c.dxf.center.x, c.dxf.center.y, c.dxf.radius) for c in circles) == [
+            (20, 20, 5), (20, 80, 5), (100, 50, 15), (180, 20, 5), (180, 80, 5)
+        ]
+
+    def test_holes_as_block_references(self, read_back):
+        """Test use_hole_blocks places scaled INSERTs of the hole block."""
+        msp = read_back(EnhancedDXFCreator(use_hole_blocks=True), RECT_PARAMS)
+        inserts = msp.query("INSERT")
+        assert len(msp.query("CIRCLE")) == 0
+        assert all(i.dxf.name == HOLE_BLOCK for i in inserts)
+        assert sorted((i.dxf.insert.x, i.dxf.insert.y, i.dxf.xscale, i.dxf.yscale) for i in inserts) == [
+            (20, 20, 5, 5), (20, 80, 5, 5), (100, 50, 15, 15), (180, 20, 5, 5), (180, 80, 5, 5)
+        ]
+
+    def test_pcd_holes_as_block_references(self, read_back):
+        """Test flange bolt holes use the hole block while bores stay circles."""
+        msp = read_back(EnhancedDXFCreator(use_hole_blocks=True), FLANGE_PARAMS)
+        assert len(msp.query("INSERT")) == 8
+        assert sorted(c.dxf.radius for c in msp.query("CIRCLE")) == [50, 100]
+
+    def test_pcd_hole_positions(self):
+        """Test bolt holes are equally spaced on the pitch circle."""
+        creator = EnhancedDXFCreator().create_new()
+        creator.add_holes_on_pcd(150, 4, 7.5, center=(100, 100))
+        centers = [(round(c.dxf.center.x, 6), round(c.dxf.center.y, 6)) for c in creator.msp]
+        assert centers == [(175, 100), (100, 175), (25, 100), (100, 25)]
+
+    def test_pcd_kernel_matches_numpy_path(self, monkeypatch):
+        """Test the loop kernel numba compiles agrees with the NumPy fallback."""
+        monkeypatch.setattr(dxf_creator, "NUMBA_AVAILABLE", False)
+        expected = dxf_creator._compute_pcd_positions(32, 75.0, 10.0, -5.0)
+        out = np.empty((32, 2))
+        dxf_creator._pcd_positions_kernel(out, 75.0, 10.0, -5.0)
+        np.testing.assert_allclose(out, expected, atol=1e-9)
+
+    def test_unimportable_numba_falls_back_to_numpy(self, monkeypatch):
+        """Test a numba that is found but fails to import still draws PCD holes."""
+        monkeypatch.setattr(dxf_creator, "NUMBA_AVAILABLE", True)
+        monkeypatch.setitem(sys.modules, "numba", None)
+        dxf_creator._jit_pcd_kernel.cache_clear()
+        try:
+            positions = dxf_creator._compute_pcd_positions(4, 75.0, 0.0, 0.0)
+            assert dxf_creator._jit_pcd_kernel() is None
+        finally:
+            dxf_creator._jit_pcd_kernel.cache_clear()
+        np.testing.assert_allclose(positions, [(75, 0), (0, 75), (-75, 0), (0, -75)], atol=1e-9)
+
+
+class TestInMemoryOutput:
+    """Test serializing a drawing without writing a file."""
+
+    def test_bytes_match_saved_file(self, tmp_path):
+        """Test create_from_params_bytes returns what create_from_params writes."""
+        output_file = tmp_path / "out.dxf"
+        creator = EnhancedDXFCreator()
+        creator.create_from_params(FLANGE_PARAMS, str(output_file))
+        saved = ezdxf.readfile(str(output_file)).modelspace()
+
+        data = EnhancedDXFCreator().create_from_params_bytes(FLANGE_PARAMS)
+        assert isinstance(data, bytes)
+        msp = ezdxf.read(io.StringIO(data.decode("utf-8"))).modelspace()
+        assert len(msp.query("CIRCLE")) == len(saved.query("CIRCLE")) == 10
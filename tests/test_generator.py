@@ -0,0 +1,123 @@
+"""
+tests/test_generator.py - Unit tests for the rule-based template parser.
+"""
+import pytest
+
+from src import generator
+from src.generator import EnhancedTemplateGenerator, _parse_cached
+
+
+@pytest.fixture
+def parser():
+    EnhancedTemplateGenerator.cache_clear()
+    return EnhancedTemplateGenerator()
+
+
+class TestParseDescription:
+    """Test cases for EnhancedTemplateGenerator.parse_description."""
+
+    def test_rectangular_with_corner_holes(self, parser):
+        """Test overlapping hole count / hole diameter / offset phrases."""
+        result = parser.parse_description(
+            "rectangular plate 200mm by 100mm with 4 holes 10mm diameter at 20mm from corners"
+        )
+        assert result == {
+            "type": "rectangular",
+            "features": [],
+            "width": 200,
+            "height": 100,
+            "hole_count": 4,
+            "hole_diameter": 10,
+            "corner_offset": 20,
+        }
+
+    def test_square_side_and_center_hole(self, parser):
+        """Test square plates take width and height from one dimension."""
+        result = parser.parse_description("square plate 150mm by 150mm with center hole 30mm diameter")
+        assert result["type"] == "square"
+        assert result["width"] == result["height"] == 150
+        assert result["center_hole_diameter"] == 30
+
+    def test_flange_diameters_and_pitch_circle(self, parser):
+        """Test flange fields and pitch circle diameter."""
+        # outer_diameter needs "circular outer diameter"; "flange" in between is not matched
+        result = parser.parse_description(
+            "circular flange outer diameter 200mm inner diameter 100mm "
+            "with 8 bolt holes 15mm diameter on 150mm pitch circle"
+        )
+        assert result["type"] == "flange"
+        assert result["inner_diameter"] == 100
+        assert result["hole_count"] == 8
+        assert result["hole_diameter"] == 15
+        assert result["pcd"] == 150
+
+    def test_first_occurrence_wins(self, parser):
+        """Test the leftmost match of a field is used, with full numbers."""
+        result = parser.parse_description("rectangular plate 120mm by 80mm with 12 holes, 3 holes 5mm diameter")
+        assert result["width"] == 120
+        assert result["hole_count"] == 12
+        assert result["hole_diameter"] == 5
+
+    def test_dimensions_depend_on_shape(self, parser):
+        """Test flange diameters are ignored for rectangular parts."""
+        result = parser.parse_description("rectangular plate 200mm by 100mm inner diameter 50mm")
+        assert "inner_diameter" not in result
+
+    def test_fillet_radius(self, parser):
+        """Test fillet radius extraction."""
+        result = parser.parse_description("rectangular plate 100mm by 50mm with 5mm radius fillet")
+        assert result["fillet_radius"] == 5
+
+    def test_shape_keyword_anywhere(self, parser):
+        """Test shape keywords are found after other fields and by priority."""
+        assert parser.parse_description("4 holes on a square, triangular gusset")["type"] == "triangular"
+        assert parser.parse_description("8 bolt holes 150mm pitch circle flange")["type"] == "flange"
+        assert parser.parse_description("square plate 80mm")["type"] == "square"
+
+    def test_mixed_case_keywords(self, parser):
+        """Test keywords written with capitals match after lowercasing."""
+        assert parser.parse_description("L-shaped bracket with 20mm radius fillet")["type"] == "l_bracket"
+        assert parser.parse_description("T-Shaped stiffener")["type"] == "t_bracket"
+        result = parser.parse_description("square plate 300mm with 4 holes 24mm diameter at 250mm PCD")
+        assert result["pcd"] == 250
+
+    def test_unknown_shape_defaults_to_rectangular(self, parser):
+        """Test descriptions without a shape keyword."""
+        result = parser.parse_description("unknown shape")
+        assert result == {"type": "rectangular", "features": []}
+
+
+class TestParseCache:
+    """Test cases for memoized parsing."""
+
+    def test_repeat_returns_independent_copies(self, parser):
+        """Test repeated descriptions are served from the cache as fresh dicts."""
+        first = parser.parse_description("Square plate 150mm")
+        first["features"].append("slot")
+        first["width"] = 0
+        second = parser.parse_description("square plate 150mm")
+        assert second == {"type": "square", "features": [], "width": 150, "height": 150}
+
+    def test_case_and_edge_whitespace_share_an_entry(self, parser):
+        """Test descriptions differing only in case and edge whitespace hit the cache."""
+        parser.parse_description("square plate 150mm")
+        parser.parse_description("  Square Plate 150mm\n")
+        assert _parse_cached.cache_info().hits == 1
+
+
+class TestScannerGuards:
+    """Test cases for the scanner's first-character guards."""
+
+    def test_guards_cover_every_pattern(self):
+        """Test each word-led pattern and shape keyword starts within its guard."""
+        for patterns in (generator._WORD_LED_PATTERNS, generator._SHAPE_KEYWORDS):
+            letters = generator._leading_letters(patterns)
+            for pattern in patterns.values():
+                assert pattern.lstrip("(?:")[0] in letters, pattern
+
+    def test_pattern_without_leading_literal_rejected(self):
+        """Test patterns the guards cannot describe fail at import instead of never matching."""
+        with pytest.raises(ValueError):
+            generator._leading_letters({"optional": r"(?:big\s+)?plate"})
+        with pytest.raises(ValueError):
+            generator._check_digit_led({"word_first": r"holes?\s+(?P<n>\d+)"})
@@ -0,0 +1,72 @@
+"""
+tests/test_json_utils.py - Unit tests for the orjson-backed JSON helpers.
+"""
+import json
+
+from src import json_utils
+
+PARAMS = {
+    "type": "flange",
+    "features": [],
+    "outer_diameter": 200,
+    "pcd": 150.5,
+    "_source": "fallback_parser",
+    "validation_errors": ["a", "b"],
+}
+
+NON_ASCII_PARAMS = {"type": "flange", "note": "⌀10 bolt holes"}
+
+
+class TestDumps:
+    """Test cases for json_utils.dumps."""
+
+    def test_matches_stdlib_layout(self):
+        """Test output is identical to json.dumps(indent=2)."""
+        assert json_utils.dumps(PARAMS) == json.dumps(PARAMS, indent=2)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test output when orjson is not installed."""
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json_utils.dumps(PARAMS) == json.dumps(PARAMS, indent=2)
+
+    def test_non_string_keys_fall_back(self):
+        """Test objects orjson rejects are still serialized."""
+        assert json.loads(json_utils.dumps({1: "a"})) == {"1": "a"}
+
+    def test_non_ascii_escaped_like_stdlib(self):
+        """Test non-ASCII text is \\u-escaped, so the output is plain ASCII."""
+        output = json_utils.dumps(NON_ASCII_PARAMS)
+        assert output == json.dumps(NON_ASCII_PARAMS, indent=2)
+        assert output.isascii()
+
+
+class TestDumpsBytes:
+    """Test cases for json_utils.dumps_bytes."""
+
+    def test_matches_dumps(self):
+        """Test bytes output is the UTF-8 encoding of dumps()."""
+        assert json_utils.dumps_bytes(PARAMS) == json_utils.dumps(PARAMS).encode()
+
+    def test_non_ascii_matches_dumps(self):
+        """Test non-ASCII text is escaped the same way in bytes output."""
+        assert json_utils.dumps_bytes(NON_ASCII_PARAMS) == json_utils.dumps(NON_ASCII_PARAMS).encode()
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test output when orjson is not installed."""
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json_utils.dumps_bytes(PARAMS) == json.dumps(PARAMS, indent=2).encode()
+
+
+class TestLoads:
+    """Test cases for json_utils.loads."""
+
+    def test_accepts_bytes_and_str(self):
+        """Test both input types parse to the same object."""
+        text = json.dumps(PARAMS)
+        assert json_utils.loads(text) == PARAMS
+        assert json_utils.loads(text.encode()) == PARAMS
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test parsing when orjson is not installed."""
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json_utils.loads(json.dumps(PARAMS).encode()) == PARAMS
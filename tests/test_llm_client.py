@@ -8,10 +8,12 @@ These tests verify:
 - Metadata fields (_source, validation_errors, raw_llm)
 """
 import json
+import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-from src.llm_client import LocalLLMClient, _extract_json_balanced
+from src import json_utils
+from src.llm_client import LocalLLMClient, _BraceBalancedStop, _extract_json_balanced, _loads_bare_object
 
 
 class TestExtractJsonBalanced:
@@ -67,13 +69,37 @@ class TestExtractJsonBalanced:
         assert result == '{"first": 1}'
 
 
+class TestBraceBalancedStop:
+    """Test cases for the JSON-closing stopping criterion."""
+
+    def test_stops_when_object_closes(self):
+        """Test the row is done at the brace that balances the first one."""
+        stop = _BraceBalancedStop(tokenizer=None)
+        assert not stop.update(0, ' {"type"')
+        assert not stop.update(0, ': "flange", "holes": {"n": 8}')
+        assert stop.update(0, '}\n')
+
+    def test_leading_close_brace_ignored(self):
+        """Test a closing brace before any opening one does not stop."""
+        stop = _BraceBalancedStop(tokenizer=None)
+        assert not stop.update(0, '} here: ')
+        assert stop.update(0, '{}')
+
+    def test_rows_are_independent(self):
+        """Test each batch row keeps its own brace depth."""
+        stop = _BraceBalancedStop(tokenizer=None, batch_size=2)
+        stop.update(0, '{"type": "square"}')
+        stop.update(1, '{"type": ')
+        assert stop.done == [True, False]
+
+
 class TestLocalLLMClientFallback:
     """Test cases for LLM client with fallback behavior."""
 
     @pytest.fixture
-    def client(self):
-        """Create a client without loading the model."""
-        return LocalLLMClient(load_model=False)
+    def client(self, fallback_client):
+        """Client without a loaded model, shared across the session."""
+        return fallback_client
 
     def test_fallback_when_no_model(self, client):
         """Test fallback parser is used when model is not loaded."""
@@ -111,11 +137,11 @@ class TestLocalLLMClientWithMockedGenerate:
 
     @pytest.fixture
     def client_with_mock_model(self):
-        """Create a client with mocked model and tokenizer."""
+        """Create a client with placeholder model and tokenizer."""
         client = LocalLLMClient(load_model=False)
-        # Mock model and tokenizer to appear loaded
-        client.model = MagicMock()
-        client.tokenizer = MagicMock()
+        # Placeholders so the client looks loaded; _generate is patched
+        client.model = object()
+        client.tokenizer = object()
         return client
 
     def test_llm_path_with_valid_json(self, client_with_mock_model):
@@ -132,6 +158,13 @@ class TestLocalLLMClientWithMockedGenerate:
         assert result["hole_count"] == 4
         assert result["validation_errors"] == []
 
+    def test_llm_type_is_interned(self, client_with_mock_model):
+        """Test the decoded type string is the interned copy."""
+        with patch.object(client_with_mock_model, '_generate', return_value='{"type": "square", "width": 50}'):
+            result = client_with_mock_model.extract_parameters("test description")
+
+        assert result["type"] is sys.intern("square")
+
     def test_llm_path_with_json_and_prefix(self, client_with_mock_model):
         """Test LLM extraction when JSON has prefix text."""
         response = 'Here is the extracted JSON:\n{"type": "square", "width": 150, "height": 150}'
@@ -143,6 +176,16 @@ class TestLocalLLMClientWithMockedGenerate:
         assert result["type"] == "square"
         assert result["width"] == 150
 
+    def test_llm_path_with_brace_inside_string(self, client_with_mock_model):
+        """Test braces inside JSON strings do not end the object early."""
+        response = '{"type": "square", "width": 150, "height": 150, "note": "slot } here"} done'
+
+        with patch.object(client_with_mock_model, '_generate', return_value=response):
+            result = client_with_mock_model.extract_parameters("test description")
+
+        assert result["_source"] == "llm"
+        assert result["note"] == "slot } here"
+
     def test_fallback_on_malformed_json(self, client_with_mock_model):
         """Test fallback is triggered for malformed JSON."""
         malformed_json = '{"type": "rectangular", "width": not_valid_json}'
@@ -214,9 +257,9 @@ class TestLocalLLMClientMetadata:
     """Test metadata fields in output."""
 
     @pytest.fixture
-    def client(self):
-        """Create a client without loading the model."""
-        return LocalLLMClient(load_model=False)
+    def client(self, fallback_client):
+        """Client without a loaded model, shared across the session."""
+        return fallback_client
 
     def test_source_field_present(self, client):
         """Test that _source field is always present."""
@@ -228,3 +271,215 @@ class TestLocalLLMClientMetadata:
         result = client.extract_parameters("rectangular plate 200mm by 100mm")
         assert "validation_errors" in result
         assert isinstance(result["validation_errors"], list)
+
+
+class TestLocalLLMClientCache:
+    """Test the per-client result cache."""
+
+    @pytest.fixture
+    def client_with_mock_model(self):
+        """Create a client with placeholder model and tokenizer."""
+        client = LocalLLMClient(load_model=False)
+        client.model = object()
+        client.tokenizer = object()
+        return client
+
+    def test_repeated_description_skips_generate(self, client_with_mock_model):
+        """Test the model runs once for a repeated description."""
+        valid_json = '{"type": "rectangular", "width": 200, "height": 100}'
+
+        with patch.object(client_with_mock_model, '_generate', return_value=valid_json) as mock_generate:
+            first = client_with_mock_model.extract_parameters("plate 200 by 100")
+            second = client_with_mock_model.extract_parameters("plate 200 by 100")
+
+        assert mock_generate.call_count == 1
+        assert first == second
+
+    def test_cached_result_is_not_shared(self, client_with_mock_model):
+        """Test mutating a returned result does not leak into later calls."""
+        valid_json = '{"type": "rectangular", "width": 200, "height": 100}'
+
+        with patch.object(client_with_mock_model, '_generate', return_value=valid_json):
+            first = client_with_mock_model.extract_parameters("plate 200 by 100")
+            first["validation_errors"].append("changed by caller")
+            first["width"] = 1
+            second = client_with_mock_model.extract_parameters("plate 200 by 100")
+
+        assert second["validation_errors"] == []
+        assert second["width"] == 200
+
+    def test_cache_disabled(self):
+        """Test cache_size=0 runs extraction every time."""
+        client = LocalLLMClient(load_model=False, cache_size=0)
+        client.model = object()
+        client.tokenizer = object()
+
+        with patch.object(client, '_generate', return_value='{"type": "square"}') as mock_generate:
+            client.extract_parameters("square plate")
+            client.extract_parameters("square plate")
+
+        assert mock_generate.call_count == 2
+
+    def test_fallback_result_not_cached(self, client_with_mock_model):
+        """Test a failed generation is retried on the next call."""
+        with patch.object(client_with_mock_model, '_generate', return_value='no json here') as mock_generate:
+            first = client_with_mock_model.extract_parameters("square plate 150mm")
+            client_with_mock_model.extract_parameters("square plate 150mm")
+
+        assert first["_source"] == "fallback_parser"
+        assert mock_generate.call_count == 2
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the cache holds at most cache_size results."""
+        client = LocalLLMClient(load_model=False, cache_size=1)
+        client.model = object()
+        client.tokenizer = object()
+
+        with patch.object(client, '_generate', return_value='{"type": "square"}') as mock_generate:
+            client.extract_parameters("square plate a")
+            client.extract_parameters("square plate b")
+            client.extract_parameters("square plate a")
+
+        assert mock_generate.call_count == 3
+
+
+class TestLocalLLMClientBatch:
+    """Test batched extraction with mocked _generate_batch."""
+
+    @pytest.fixture
+    def client_with_mock_model(self):
+        """Create a client with placeholder model and tokenizer."""
+        client = LocalLLMClient(load_model=False)
+        client.model = object()
+        client.tokenizer = object()
+        return client
+
+    def test_results_in_input_order(self, client_with_mock_model):
+        """Test each description gets its own output, valid or fallback."""
+        outputs = ['{"type": "square", "width": 150, "height": 150}', 'not json']
+
+        with patch.object(client_with_mock_model, '_generate_batch', return_value=outputs) as mock_batch:
+            results = client_with_mock_model.extract_parameters_batch(
+                ["square plate 150mm", "rectangular plate 200mm by 100mm"]
+            )
+
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][0]) == 2
+        assert results[0]["_source"] == "llm"
+        assert results[0]["width"] == 150
+        assert results[1]["_source"] == "fallback_parser"
+        assert results[1]["width"] == 200
+        assert "raw_llm" in results[1]
+
+    def test_duplicates_and_cache_hits_not_regenerated(self, client_with_mock_model):
+        """Test only new, distinct descriptions reach the model."""
+        valid_json = '{"type": "square", "width": 150, "height": 150}'
+        with patch.object(client_with_mock_model, '_generate', return_value=valid_json):
+            client_with_mock_model.extract_parameters("square plate 150mm")
+
+        with patch.object(client_with_mock_model, '_generate_batch', return_value=[valid_json]) as mock_batch:
+            results = client_with_mock_model.extract_parameters_batch(
+                ["square plate 150mm", "square plate 80mm", "square plate 80mm"]
+            )
+
+        assert mock_batch.call_args[0][0] == [client_with_mock_model._build_prompt("square plate 80mm")]
+        assert [r["_source"] for r in results] == ["llm", "llm", "llm"]
+        results[1]["width"] = 1
+        assert results[2]["width"] == 150
+
+    def test_generation_error_falls_back(self, client_with_mock_model):
+        """Test a failed batch falls back for every description."""
+        with patch.object(client_with_mock_model, '_generate_batch', side_effect=RuntimeError("OOM")):
+            results = client_with_mock_model.extract_parameters_batch(["square plate 150mm", "flange"])
+
+        assert all(r["_source"] == "fallback_parser" for r in results)
+        assert all("LLM error: OOM" in r["validation_errors"] for r in results)
+
+    def test_without_model_uses_fallback(self):
+        """Test batching without a model uses the rule-based parser."""
+        client = LocalLLMClient(load_model=False)
+        results = client.extract_parameters_batch(["square plate 150mm"])
+        assert results[0]["_source"] == "fallback_parser"
+        assert results[0]["width"] == 150
+
+    def test_generate_is_a_batch_of_one(self, client_with_mock_model):
+        """Test single-prompt generation goes through _generate_batch."""
+        with patch.object(client_with_mock_model, '_generate_batch', return_value=['{"type": "square"}']) as mock_batch:
+            assert client_with_mock_model._generate("prompt") == '{"type": "square"}'
+        mock_batch.assert_called_once_with(["prompt"])
+
+
+class TestLocalLLMClientQuantization:
+    """Test the quantization option."""
+
+    def test_unknown_mode_rejected(self):
+        """Test an unsupported quantization raises before anything loads."""
+        with pytest.raises(ValueError):
+            LocalLLMClient(load_model=False, quantization="int3")
+
+    def test_fp16_has_no_quantization_config(self):
+        """Test the default mode loads unquantized weights."""
+        client = LocalLLMClient(load_model=False)
+        assert client.quantization == "fp16"
+        assert client._quantization_config() is None
+
+
+class WordTokenizer:
+    """Whitespace tokenizer with a BOS id, enough to exercise prompt splitting."""
+
+    def __init__(self):
+        self.vocab = {}
+
+    def _encode(self, text, add_special_tokens):
+        ids = [self.vocab.setdefault(word, len(self.vocab) + 2) for word in text.split()]
+        return [1] + ids if add_special_tokens else ids
+
+    def __call__(self, text, add_special_tokens=True):
+        if isinstance(text, list):
+            return {"input_ids": [self._encode(t, add_special_tokens) for t in text]}
+        return {"input_ids": self._encode(text, add_special_tokens)}
+
+
+class WholeTextTokenizer(WordTokenizer):
+    """Tokenizer that maps each input string to a single id."""
+
+    def _encode(self, text, add_special_tokens):
+        ids = [self.vocab.setdefault(text, len(self.vocab) + 2)]
+        return [1] + ids if add_special_tokens else ids
+
+
+class TestPromptTokenization:
+    """Test reuse of pre-tokenized prompt prefix and suffix."""
+
+    def test_pieces_cached_when_they_match_full_prompt(self):
+        """Test prefix + description + suffix ids equal full-prompt ids."""
+        client = LocalLLMClient(load_model=False)
+        client.tokenizer = WordTokenizer()
+        prefix_ids, suffix_ids = client._split_prompt_ids()
+
+        description = "square plate 150mm with center hole"
+        full_ids = client.tokenizer(client._build_prompt(description))["input_ids"]
+        description_ids = client.tokenizer(description, add_special_tokens=False)["input_ids"]
+        assert prefix_ids + description_ids + suffix_ids == full_ids
+
+    def test_falls_back_when_pieces_differ(self):
+        """Test whole-prompt tokenization when boundaries change the ids."""
+        client = LocalLLMClient(load_model=False)
+        client.tokenizer = WholeTextTokenizer()
+        assert client._split_prompt_ids() is None
+
+
+class TestLoadsBareObject:
+    """Test cases for the orjson fast path on bare JSON output."""
+
+    def test_bare_object(self):
+        """Test an output that is just the object is parsed."""
+        if not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        assert _loads_bare_object(' {"type": "square", "width": 150}\n') == {"type": "square", "width": 150}
+
+    def test_other_outputs_left_to_brace_scan(self):
+        """Test prefixed text, trailing text and non-objects return None."""
+        assert _loads_bare_object('Here: {"type": "square"}') is None
+        assert _loads_bare_object('{"type": "square"} and more') is None
+        assert _loads_bare_object('[1, 2]') is None
@@ -0,0 +1,21 @@
+"""
+tests/test_main.py - Unit tests for the batch test case pipeline.
+"""
+from main import process_all_test_cases
+
+
+class TestProcessAllTestCases:
+    """Test cases for sequential and pooled batch runs."""
+
+    def test_pool_matches_sequential(self, tmp_path, capsys):
+        """Test a pooled run reports the same results and prints them in the same order."""
+        sequential = process_all_test_cases(output_dir=str(tmp_path))
+        sequential_output = capsys.readouterr().out
+
+        pooled = process_all_test_cases(max_workers=2, output_dir=str(tmp_path))
+        pooled_output = capsys.readouterr().out
+
+        assert pooled == sequential
+        assert sequential[0] == sequential[1]
+        assert pooled_output == sequential_output
+        assert len(list(tmp_path.glob("test_case_*.dxf"))) == sequential[1]
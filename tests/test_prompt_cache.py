@@ -0,0 +1,141 @@
+"""
+tests/test_prompt_cache.py - Unit tests for the exact/semantic prompt cache.
+
+The semantic tier is exercised with a bag-of-words embedder so the tests do not
+need sentence-transformers.
+"""
+import re
+import threading
+
+import numpy as np
+
+from src.prompt_cache import PromptCache, normalize_description
+
+VOCAB = ["rectangular", "rectangle", "plate", "square", "circular", "flange", "holes", "slots", "with", "mm", "by"]
+
+
+def bag_of_words_embedder(text):
+    """Unit-length word-count vector over a tiny fixed vocabulary."""
+    words = re.sub(r"\d+", "", text).split()
+    vector = np.array([float(words.count(w)) for w in VOCAB]) + 1e-3
+    return vector / np.linalg.norm(vector)
+
+
+class TestNormalizeDescription:
+    """Test cases for description normalization."""
+
+    def test_lowercases_and_collapses_whitespace(self):
+        """Test case and whitespace differences normalize to one key."""
+        assert normalize_description("  Square   Plate\t150mm ") == "square plate 150mm"
+
+
+class TestExactTier:
+    """Test cases for the exact-match LRU tier."""
+
+    def test_miss_returns_none(self):
+        """Test lookup of an unknown description."""
+        cache = PromptCache()
+        assert cache.get("square plate 150mm", "Template (Fast)") is None
+
+    def test_hit_after_put(self):
+        """Test a stored value is returned for the same description."""
+        cache = PromptCache()
+        cache.put("square plate 150mm", "Template (Fast)", {"type": "square"})
+        assert cache.get("Square plate  150mm", "Template (Fast)") == {"type": "square"}
+
+    def test_parser_type_is_part_of_key(self):
+        """Test results are not shared across parser modes."""
+        cache = PromptCache()
+        cache.put("square plate 150mm", "Template (Fast)", {"type": "square"})
+        assert cache.get("square plate 150mm", "LLM (Smart)") is None
+
+    def test_returned_value_is_a_copy(self):
+        """Test mutating a returned value does not change the cache."""
+        cache = PromptCache()
+        cache.put("square plate 150mm", "Template (Fast)", {"type": "square", "features": []})
+        cache.get("square plate 150mm", "Template (Fast)")["features"].append("slot")
+        assert cache.get("square plate 150mm", "Template (Fast)")["features"] == []
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = PromptCache(maxsize=2)
+        cache.put("a", "t", 1)
+        cache.put("b", "t", 2)
+        cache.get("a", "t")
+        cache.put("c", "t", 3)
+        assert len(cache) == 2
+        assert cache.get("b", "t") is None
+        assert cache.get("a", "t") == 1
+        assert cache.get("c", "t") == 3
+
+
+class TestSemanticTier:
+    """Test cases for the embedding-based tier."""
+
+    def test_near_duplicate_hits(self):
+        """Test a reworded description with the same numbers hits."""
+        cache = PromptCache(embedder=bag_of_words_embedder, threshold=0.9)
+        cache.put("rectangular plate 200mm by 100mm", "Hybrid (Best)", {"width": 200})
+        assert cache.get("rectangular plate with 200mm by 100mm", "Hybrid (Best)") == {"width": 200}
+
+    def test_different_numbers_never_hit(self):
+        """Test similar wording with different dimensions misses."""
+        cache = PromptCache(embedder=bag_of_words_embedder, threshold=0.0)
+        cache.put("rectangular plate 200mm by 100mm", "Hybrid (Best)", {"width": 200})
+        assert cache.get("rectangular plate 200mm by 150mm", "Hybrid (Best)") is None
+
+    def test_below_threshold_misses(self):
+        """Test dissimilar descriptions with the same numbers miss."""
+        cache = PromptCache(embedder=bag_of_words_embedder, threshold=0.99)
+        cache.put("rectangular plate 200mm by 100mm", "Hybrid (Best)", {"width": 200})
+        assert cache.get("flange 200mm 100mm", "Hybrid (Best)") is None
+
+    def test_different_content_words_never_hit(self):
+        """Test a changed shape or feature word misses even at zero threshold."""
+        cache = PromptCache(embedder=bag_of_words_embedder, threshold=0.0)
+        cache.put("square plate 100mm with 4 holes", "Hybrid (Best)", {"type": "square"})
+        assert cache.get("circular plate 100mm with 4 holes", "Hybrid (Best)") is None
+        assert cache.get("square plate 100mm with 4 slots", "Hybrid (Best)") is None
+
+    def test_swapped_words_between_numbers_never_hit(self):
+        """Test swapping which diameter is inner and which is outer misses."""
+        cache = PromptCache(embedder=bag_of_words_embedder, threshold=0.0)
+        cache.put(
+            "circular flange outer diameter 100mm inner diameter 200mm",
+            "Hybrid (Best)", {"outer_diameter": 100, "inner_diameter": 200}
+        )
+        assert cache.get("circular flange inner diameter 100mm outer diameter 200mm", "Hybrid (Best)") is None
+
+    def test_eviction_removes_semantic_entry(self):
+        """Test evicted descriptions are no longer semantic candidates."""
+        cache = PromptCache(maxsize=1, embedder=bag_of_words_embedder, threshold=0.9)
+        cache.put("rectangular plate 200mm by 100mm", "Hybrid (Best)", {"width": 200})
+        cache.put("square plate 50mm", "Hybrid (Best)", {"width": 50})
+        assert cache.get("rectangular plate with 200mm by 100mm", "Hybrid (Best)") is None
+
+
+class TestThreadSafety:
+    """Test cases for a cache shared between threads."""
+
+    def test_concurrent_get_and_put(self):
+        """Test interleaved lookups and evictions from several threads do not raise."""
+        cache = PromptCache(maxsize=4, embedder=bag_of_words_embedder, threshold=0.9)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(500):
+                    description = f"rectangular plate {(i + offset) % 8}mm by 100mm"
+                    cache.put(description, "Hybrid (Best)", {"width": i})
+                    cache.get(f"rectangular plate with {(i + offset) % 8}mm by 100mm", "Hybrid (Best)")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) <= 4
@@ -1,6 +1,11 @@
 """
 tests/test_validator.py - Unit tests for the validator module.
 """
+from collections import OrderedDict
+
+import pytest
+
+from src import validator
 from src.validator import validate_params, VALID_TYPES
 
 
@@ -124,6 +129,13 @@ class TestValidateParams:
         assert is_valid is False
         assert len(errors) > 0
 
+    def test_dict_subclass_params(self):
+        """Test validation accepts dict subclasses such as OrderedDict."""
+        params = OrderedDict(type="rectangular", width=200, height=100)
+        is_valid, errors = validate_params(params)
+        assert is_valid is True
+        assert errors == []
+
     def test_float_dimensions(self):
         """Test validation accepts float dimensions."""
         params = {"type": "rectangular", "width": 200.5, "height": 100.25}
@@ -146,6 +158,53 @@ class TestValidateParams:
         assert len(errors) > 0
 
 
+class TestConservativeValidation:
+    """Test cases for the checks used when jsonschema is not installed."""
+
+    @pytest.fixture(autouse=True)
+    def without_jsonschema(self, monkeypatch):
+        monkeypatch.setattr(validator, "FASTJSONSCHEMA_AVAILABLE", False)
+        monkeypatch.setattr(validator, "JSONSCHEMA_AVAILABLE", False)
+
+    def test_valid_params(self):
+        """Test well-typed params pass."""
+        params = {"type": "flange", "outer_diameter": 200.5, "hole_count": 8, "features": []}
+        assert validate_params(params) == (True, [])
+
+    def test_field_errors(self):
+        """Test each kind of field check reports its own message."""
+        params = {"type": "square", "width": "150", "height": -1, "hole_count": 2.5, "features": "slot"}
+        is_valid, errors = validate_params(params)
+        assert is_valid is False
+        assert errors == [
+            "Field 'width' must be a number, got str",
+            "Field 'height' must be non-negative, got -1",
+            "Field 'hole_count' must be an integer, got float",
+            "Field 'features' must be a list, got str",
+        ]
+
+    def test_unknown_fields_ignored(self):
+        """Test fields without a spec are not checked."""
+        assert validate_params({"type": "square", "material": 5}) == (True, [])
+
+
+@pytest.mark.skipif(not validator.FASTJSONSCHEMA_AVAILABLE, reason="fastjsonschema not installed")
+class TestFastJsonSchemaValidation:
+    """Test cases for the fastjsonschema path."""
+
+    def test_valid_params(self):
+        """Test well-typed params pass."""
+        assert validate_params({"type": "rectangular", "width": 200, "hole_count": 4}) == (True, [])
+
+    def test_first_error_without_jsonschema(self, monkeypatch):
+        """Test the fastjsonschema message is reported when jsonschema is missing."""
+        monkeypatch.setattr(validator, "JSONSCHEMA_AVAILABLE", False)
+        is_valid, errors = validate_params({"type": "rectangular", "width": -1})
+        assert is_valid is False
+        assert len(errors) == 1
+        assert "width" in errors[0]
+
+
 class TestValidTypes:
     """Test cases for VALID_TYPES constant."""
 